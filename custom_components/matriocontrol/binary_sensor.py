@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
@@ -34,44 +33,41 @@ async def async_setup_entry(
 class MatrioControlDeviceStatusBinarySensor(MatrioControlEntity, BinarySensorEntity):
     """Representation of a Matrio device connectivity status."""
 
+    _attr_name = "Device Status"
+    _attr_device_class = "connectivity"
+
     def __init__(
         self, 
         coordinator: MatrioControlDataUpdateCoordinator
     ) -> None:
         """Initialize the device status binary sensor."""
         super().__init__(coordinator, 0)  # Use zone 0 for device-level sensor
-        self._attr_name = "Device Status"
         self._attr_unique_id = f"{coordinator.entry.entry_id}_device_status"
-        self._attr_device_class = "connectivity"
+        self._update_attrs()
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the device is connected and responding."""
+    def _update_attrs(self) -> bool:
+        """Set the connection state and device attributes from coordinator data."""
+        data = self.coordinator.data
         # Check if the coordinator has recent data and connection is active
-        if not self.coordinator.data:
-            return False
+        if not data:
+            return self._set_attrs(is_on=False, extra_state_attributes={})
         
         # Check if we have a connection to the device
-        return self.coordinator.data.get("connected", False)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+        is_on = data.get("connected", False)
         attrs = {}
         
-        if self.coordinator.data:
-            # Add device information as attributes
-            device_info = self.coordinator.data.get("device_info", {})
-            if device_info:
-                attrs.update({
-                    "device_name": device_info.get("device_name"),
-                    "mac_address": device_info.get("mac_address"),
-                    "firmware": device_info.get("firmware"),
-                    "hardware": device_info.get("hardware"),
-                })
-            
-            # Add connection status
-            attrs["last_update"] = self.coordinator.last_update_success
-            attrs["connection_status"] = "connected" if self.is_on else "disconnected"
+        # Add device information as attributes
+        device_info = data.get("device_info", {})
+        if device_info:
+            attrs.update({
+                "device_name": device_info.get("device_name"),
+                "mac_address": device_info.get("mac_address"),
+                "firmware": device_info.get("firmware"),
+                "hardware": device_info.get("hardware"),
+            })
+        
+        # Add connection status
+        attrs["last_update"] = self.coordinator.last_update_success
+        attrs["connection_status"] = "connected" if is_on else "disconnected"
         
-        return attrs
+        return self._set_attrs(is_on=is_on, extra_state_attributes=attrs)
@@ -7,9 +7,10 @@ from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import DEVICE_MANUFACTURER, DEVICE_MODEL, DOMAIN, INPUTS, ZONES
 from .matrio_controller import MatrioController
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,6 +18,43 @@ _LOGGER = logging.getLogger(__name__)
 UPDATE_INTERVAL = timedelta(seconds=60)  # Minimal polling - rely on broadcast updates for real-time changes
 
 
+def _input_name_index(inputs: dict[int, str]) -> dict[str, int]:
+    """Map input names back to input IDs, the lowest ID wins if a name repeats."""
+    return {name: input_id for input_id, name in reversed(inputs.items())}
+
+
+def _input_choices(inputs: dict[int, str]) -> dict[str, dict[str, int] | list[str]]:
+    """Build the source list and its name lookup from one mapping, default names if it is empty."""
+    inputs = inputs or INPUTS
+    return {
+        "input_name_to_id": _input_name_index(inputs),
+        "input_options": list(inputs.values()),
+    }
+
+
+# Numeric balance for the decoder's named balance labels, other labels are numeric strings
+_BALANCE_VALUES = {"MAX Right": 100.0, "MAX Left": -100.0, "Default": 0.0, "Center": 0.0}
+
+
+def _balance_value(balance: str | None) -> float:
+    """Convert a balance label to -100..+100, unknown labels read as center."""
+    value = _BALANCE_VALUES.get(balance)
+    if value is None:
+        try:
+            value = float(balance)
+        except (ValueError, TypeError):
+            value = 0.0
+    return value
+
+
+def _convert_zone_states(zones: dict[int, dict]) -> dict[int, dict]:
+    """Copy the controller's zone states, adding a numeric balance_value to each zone with a balance."""
+    return {
+        zone_id: {**state, "balance_value": _balance_value(state["balance"])} if "balance" in state else dict(state)
+        for zone_id, state in zones.items()
+    }
+
+
 class MatrioControlDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the Matrio device."""
 
@@ -27,7 +65,13 @@ class MatrioControlDataUpdateCoordinator(DataUpdateCoordinator):
             entry.data["host"], 
             entry.data["port"]
         )
-        self._entities = []  # Track entities for direct updates
+        # Shared by every entity of this config entry
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.data.get("name", "Matrio Control"),
+            manufacturer=DEVICE_MANUFACTURER,
+            model=DEVICE_MODEL,
+        )
         
         super().__init__(
             hass,
@@ -54,10 +98,12 @@ class MatrioControlDataUpdateCoordinator(DataUpdateCoordinator):
                 connected = await self.controller.connect(state_callback)
                 if not connected:
                     _LOGGER.debug("Connection failed")
+                    inputs = self.controller.get_available_inputs()
                     return {
                         "connected": False,
                         "zones": {},
-                        "inputs": self.controller.get_available_inputs(),
+                        "inputs": inputs,
+                        **_input_choices(inputs),
                         "device_info": {},
                         "last_heartbeat": None,
                         "zone_states": {},
@@ -65,7 +111,7 @@ class MatrioControlDataUpdateCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("Connection successful")
             
             # Get current zone states from the controller
-            zone_states = self.controller.zones.copy()
+            zone_states = _convert_zone_states(self.controller.zones)
             _LOGGER.debug("Retrieved %d zones from controller", len(zone_states))
             
             # If we don't have zone states yet, wait for them to be populated
@@ -74,7 +120,7 @@ class MatrioControlDataUpdateCoordinator(DataUpdateCoordinator):
                 # Wait up to 5 seconds for zone states to be populated
                 for _ in range(50):  # 50 * 0.1 = 5 seconds
                     await asyncio.sleep(0.1)
-                    zone_states = self.controller.zones.copy()
+                    zone_states = _convert_zone_states(self.controller.zones)
                     if zone_states:
                         _LOGGER.debug("Zone states now available: %d zones", len(zone_states))
                         break
@@ -104,7 +150,7 @@ class MatrioControlDataUpdateCoordinator(DataUpdateCoordinator):
             # Create zones dictionary with proper names
             zones_dict = {}
             for i in range(1, 9):
-                zone_name = zone_names.get(i, f"Zone {i}")
+                zone_name = zone_names.get(i, ZONES[i])
                 zones_dict[f"zone_{i}"] = zone_name
                 _LOGGER.debug("Zone %d: %s", i, zone_name)
             
@@ -116,6 +162,7 @@ class MatrioControlDataUpdateCoordinator(DataUpdateCoordinator):
                 "names": {},
                 "last_heartbeat": True,
                 "input_mappings": input_mappings,
+                **_input_choices(input_mappings),
                 "zone_names": zone_names,
                 "zone_states": zone_states,
             }
@@ -126,43 +173,36 @@ class MatrioControlDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.debug("Coordinator update failed with error: %s", err)
             _LOGGER.error("Error communicating with Matrio device: %s", err)
+            inputs = self.controller.get_available_inputs()
             return {
                 "connected": False,
                 "zones": {},
-                "inputs": self.controller.get_available_inputs(),
+                "inputs": inputs,
+                **_input_choices(inputs),
                 "device_info": {},
                 "names": {},
                 "last_heartbeat": None,
                 "zone_states": {},
             }
     
-    def register_entity(self, entity):
-        """Register an entity for direct state updates."""
-        if entity not in self._entities:
-            self._entities.append(entity)
-            _LOGGER.debug("Registered entity: %s", entity.entity_id)
-    
-    def unregister_entity(self, entity):
-        """Unregister an entity from direct state updates."""
-        if entity in self._entities:
-            self._entities.remove(entity)
-            _LOGGER.debug("Unregistered entity: %s", entity.entity_id)
-    
     def _update_entities_from_zones(self, zones):
-        """Update all registered entities with new zone data."""
+        """Update all entities with new zone data."""
         if not zones:
             return
         
-        _LOGGER.debug("Updating %d entities with zone data", len(self._entities))
+        _LOGGER.debug("Updating entities with zone data for %d zones", len(zones))
         
         # Update coordinator data immediately
         current_data = self.data or {}
-        current_data["zone_states"] = zones
+        current_data["zone_states"] = _convert_zone_states(zones)
         self.data = current_data
         
-        # Schedule entity updates on the event loop
-        for entity in self._entities:
-            if hasattr(entity, 'schedule_update_ha_state'):
-                # Use schedule_update_ha_state for immediate entity updates
-                entity.schedule_update_ha_state()
-                _LOGGER.debug("Scheduled update for entity: %s", entity.entity_id)
+        # Entities set their state from the new data and write it if it changed
+        self.async_update_listeners()
+    
+    async def async_resync_zones(self) -> None:
+        """Read every zone's state back from the device and update the entities with it."""
+        zones = await self.controller.get_zone_states(self.controller.get_available_inputs())
+        if zones:
+            self.controller.zones = zones
+            self._update_entities_from_zones(zones)
@@ -1,10 +1,11 @@
 """Base entity for Matrio Control."""
 from __future__ import annotations
 
-from homeassistant.helpers.entity import DeviceInfo, Entity
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DEVICE_MANUFACTURER, DEVICE_MODEL, DOMAIN
 from .coordinator import MatrioControlDataUpdateCoordinator
 
 
@@ -19,17 +20,28 @@ class MatrioControlEntity(CoordinatorEntity[MatrioControlDataUpdateCoordinator])
         """Initialize the entity."""
         super().__init__(coordinator)
         self.zone_id = zone_id
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.entry.entry_id)},
-            name=coordinator.entry.data.get("name", "Matrio Control"),
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-        )
-        # Register this entity for direct state updates
-        coordinator.register_entity(self)
+        self._attr_device_info = coordinator.device_info
+        # Availability of the last state write, the first one is when the entity is added
+        self._written_available = self.available
+    
+    def _update_attrs(self) -> bool:
+        """Set the entity's _attr_ values from coordinator data, return whether any of them changed."""
+        return True
+    
+    def _set_attrs(self, **values: Any) -> bool:
+        """Set _attr_<name> to each value, return whether any of them changed."""
+        changed = False
+        for name, value in values.items():
+            attr = f"_attr_{name}"
+            if getattr(self, attr, None) != value:
+                setattr(self, attr, value)
+                changed = True
+        return changed
     
-    async def async_will_remove_from_hass(self) -> None:
-        """Called when entity will be removed from Home Assistant."""
-        # Unregister from coordinator when entity is removed
-        self.coordinator.unregister_entity(self)
-        await super().async_will_remove_from_hass()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, skipping the state write if nothing changed."""
+        if not self._update_attrs() and self.available == self._written_available:
+            return
+        self._written_available = self.available
+        super()._handle_coordinator_update()
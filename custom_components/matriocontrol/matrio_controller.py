@@ -22,19 +22,209 @@ import time
 import struct
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Final
 
 _LOGGER = logging.getLogger(__name__)
 
+# ALLNAMES packet layout, from packet capture:
+# Header:  18961820a3000000823400000000000000000000
+# Payload: 4d43552b5041532b82150b4441582038385f363136450b4c6976696e6720526f6f6d0e4d617374657220426564726f6f6d0d4465636b2055707374616972730f4465636b20446f776e7374616972730a446f776e737461697273065a4f4e453636055a4f4e4537055a4f4e45380254560c476f6f676c65204d7573696306496e7075743306496e7075743406496e7075743507496e707574363606496e70757437cc26
+# MCU+PAS+ (8 bytes) + 8215 (2 bytes) + length-prefixed device name, 8 zone names, 8 input names
+_ALLNAMES_HDR_LEN: Final = 20  # Protocol header preceding the MCU+PAS+ payload
+_ALLNAMES_DATA_OFFSET: Final = 30  # Header + MCU+PAS+ (8 bytes) + 8215 command (2 bytes)
+_MCU_PAS: Final = b"MCU+PAS+"
+
+# HNG sync frame payload start, anchored on MCU+PAS+ so an 82 0c inside a name field can't match
+_HNG_SIGNATURE: Final = _MCU_PAS + b"\x82\x0c"
+
+# HNG section field offsets: input, volume, power, balance, mute, bass, treble
+# Balance (34), bass (26) and treble (18) confirmed by differential analysis
+_OFFS96: Final = (2, 10, 44, 34, 52, 26, 18)
+_OFFS68: Final = (2, 10, 50, 34, 28, 26, 18)
+
+# Power/mute label per raw byte, indexed [packet_size == 96][value], None if unknown
+# 96-byte: power 0x02=ON, 0x01=OFF; mute 0x01=Default, 0x02=Muted
+# 68-byte: power 0x01=ON, 0x02=OFF (reversed zone mapping); mute 0x0d=Default, 0x02=Muted
+_POWER_STATES: Final = tuple(
+    tuple(states.get(v) for v in range(256))
+    for states in ({0x01: "ON", 0x02: "OFF"}, {0x02: "ON", 0x01: "OFF"})
+)
+_MUTE_STATES: Final = tuple(
+    tuple(states.get(v) for v in range(256))
+    for states in ({0x0d: "DEFAULT", 0x02: "MUTED"}, {0x01: "DEFAULT", 0x02: "MUTED"})
+)
+
+_VALID_IDS: Final = frozenset(range(1, 9))  # Zone and input IDs are both 1-8
+
+# Command packets: 20-byte header + MCU+PAS+ + 82 [COMMAND] + [VALUE] [ZONE PATTERN] + ff cc 26
+_CMD_OFFSET: Final = 29  # [COMMAND] byte following 82
+_CMD_VALUE_OFFSET: Final = 30  # First byte after 82 [COMMAND]
+_CMD_ZONE_OFFSET: Final = 31  # 8-byte zone pattern following the value byte
+_PKT_MAGIC: Final = b"\x18\x96\x18\x20"
+_PKT_TRAILER: Final = b"\xff\xcc\x26"
+_MAX_FRAME_LEN: Final = 1024  # Sanity limit for a header's length field, larger means a bad header
+# Length the 0x0c sync frame declares, captures show it with 76 or 75 bytes after the header
+_HNG_DECLARED_LEN: Final = 0x4c
+
+# Packet header: magic, length of everything after the 20-byte header, 12-byte data block
+_HEADER: Final = struct.Struct("<4sI12s")
+# 22-byte command templates from packet capture: MCU+PAS+ 82 [COMMAND] [VALUE] + zone pattern (all 02s)
+# Value and zone bytes are filled in on a copy per command
+_INPUT_TEMPLATE: Final = (
+    _HEADER.pack(_PKT_MAGIC, 0x16, b"\xb6\x04" + bytes(10)) + _MCU_PAS + b"\x82\x0d\x00" + b"\x02" * 8 + _PKT_TRAILER
+)
+_VOL_TEMPLATE: Final = (
+    _HEADER.pack(_PKT_MAGIC, 0x16, b"\xb6\x04" + bytes(10)) + _MCU_PAS + b"\x82\x01\x00" + b"\x02" * 8 + _PKT_TRAILER
+)
+_MUTE_ON_TEMPLATE: Final = (
+    _HEADER.pack(_PKT_MAGIC, 0x16, b"\xb1\x04" + bytes(10)) + _MCU_PAS + b"\x82\x0e\x02" + b"\x02" * 8 + _PKT_TRAILER
+)
+_MUTE_OFF_TEMPLATE: Final = (
+    _HEADER.pack(_PKT_MAGIC, 0x16, b"\xb0\x04" + bytes(10)) + _MCU_PAS + b"\x82\x0e\x01" + b"\x02" * 8 + _PKT_TRAILER
+)
+# Audio control (balance/bass/treble) packets: header + MCU+PAS+, then 82 [COMMAND] [VALUE] + zone pattern
+_AUDIO_HEADER: Final = _HEADER.pack(_PKT_MAGIC, 0x16, b"\xe3\x04" + bytes(10)) + _MCU_PAS
+
+# Initialization command (0x0a), answered with an HNG sync packet followed by ALLNAMES
+_INIT_PACKET: Final = bytes.fromhex("189618200f0000005706000000000000000000004d43552b5041532b820affffff8926")
+# Complete packets for _send_protocol_command, keyed by command
+_PROTO_PACKETS: Final = {
+    0x0a: _INIT_PACKET,
+    0x0c: bytes.fromhex(
+        "189618204c000000a908000000000000000000004d43552b5041532b"
+        "820c0108080808080808070f22171d0805050d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+        "1f1f1f1f1f1f1f1f02010201010101010101010102010101010140180c14ffffcc26"
+    ),
+}
+
+_NAMES_CACHE_TTL: Final = 60.0  # Seconds an ALLNAMES frame is reused for name queries
+_ACK_TIMEOUT: Final = 2.0  # Seconds to wait for a command acknowledgement
+_SYNC_TIMEOUT: Final = 5.0  # Seconds to wait for sync/name responses and broadcasts
+
+_UPNP_PORT: Final = 59152  # UPnP event/SOAP port used during initialization
+_SUBSCRIBE_TMPL: Final = (
+    "SUBSCRIBE /upnp/event/%s HTTP/1.1\r\n"
+    "Host: %s:%d\r\n"
+    "Content-Length: 0\r\n"
+    "Connection: keep-alive\r\n"
+    "TIMEOUT: Second-1800\r\n"
+    "NT: upnp:event\r\n"
+    "User-Agent: iOS/7.0 UPnP/1.1 UPNPX/1.2.4\r\n"
+    "CALLBACK: <http://%s:22809/Event>\r\n"
+    "Accept-Encoding: gzip, deflate\r\n"
+    "\r\n"
+)
+_SOAP_TMPL: Final = (
+    "POST /upnp/control/%s HTTP/1.1\r\n"
+    "Host: %s\r\n"
+    "SOAPACTION: \"%s\"\r\n"
+    "Content-Type: text/xml; charset=\"utf-8\"\r\n"
+    "Content-Length: %d\r\n"
+    "\r\n"
+    "%s"
+)
+_SOAP_ENVELOPE: Final = (
+    "<?xml version=\"1.0\" encoding=\"utf-8\"?><s:Envelope s:encodingStyle=\"http://schemas.xmlsoap.org/soap/encoding/\" "
+    "xmlns:s=\"http://schemas.xmlsoap.org/soap/envelope/\"><s:Body>%s</s:Body></s:Envelope>"
+)
+# (control path, SOAP action, body) sent in order after the event subscriptions
+_SOAP_COMMANDS: Final = (
+    (
+        "rendercontrol1",
+        "urn:schemas-upnp-org:service:RenderingControl:1#GetControlDeviceInfo",
+        _SOAP_ENVELOPE % (
+            "<u:GetControlDeviceInfo xmlns:u=\"urn:schemas-upnp-org:service:RenderingControl:1\">"
+            "<InstanceID>0</InstanceID></u:GetControlDeviceInfo>"
+        ),
+    ),
+    (
+        "rendertransport1",
+        "urn:schemas-upnp-org:service:AVTransport:1#GetInfoEx",
+        _SOAP_ENVELOPE % (
+            "<u:GetInfoEx xmlns:u=\"urn:schemas-upnp-org:service:AVTransport:1\">"
+            "<InstanceID>0</InstanceID></u:GetInfoEx>"
+        ),
+    ),
+    (
+        "rendercontrol1",
+        "urn:schemas-upnp-org:service:RenderingControl:1#GetChannel",
+        _SOAP_ENVELOPE % (
+            "<u:GetChannel xmlns:u=\"urn:schemas-upnp-org:service:RenderingControl:1\">"
+            "<InstanceID>0</InstanceID><Channel>Master</Channel></u:GetChannel>"
+        ),
+    ),
+)
+
+# Power packets: magic, length, 12-byte data block, MCU+PAS+, 82 08, zone pattern, trailer
+# ON uses an 11-byte shifted pattern (24-byte length), OFF a 9-byte dual pattern (22-byte length)
+_POWER_ON_STRUCT: Final = struct.Struct("<4sI12s8s2s11s3s")
+_POWER_OFF_STRUCT: Final = struct.Struct("<4sI12s8s2s9s3s")
+_POWER_ON_DATA: Final = b"\xab\x04" + bytes(10)
+_POWER_OFF_DATA: Final = b"\xaa\x04" + bytes(10)
+
+# Zone selection patterns indexed by zone_id - 1 (01 = selected, 02 = not selected)
+_ZONE8: Final = tuple(bytes(0x01 if i == z else 0x02 for i in range(8)) for z in range(8))
+# Power ON: shifted pattern, 02 + zone pattern + 02 (11 bytes)
+_PWR_ON_PATTERNS: Final = tuple(bytes(0x01 if i == z + 1 else 0x02 for i in range(11)) for z in range(8))
+# Power OFF: dual pattern, 01 at position 0 + zone pattern (9 bytes)
+_PWR_OFF_PATTERNS: Final = tuple(bytes(0x01 if i in (0, z + 1) else 0x02 for i in range(9)) for z in range(8))
+
+# Complete power packets indexed by zone_id - 1, there are only 8 of each
+_PWR_ON_PACKETS: Final = tuple(
+    _POWER_ON_STRUCT.pack(_PKT_MAGIC, 0x18, _POWER_ON_DATA, _MCU_PAS, b"\x82\x08", pattern, _PKT_TRAILER)
+    for pattern in _PWR_ON_PATTERNS
+)
+_PWR_OFF_PACKETS: Final = tuple(
+    _POWER_OFF_STRUCT.pack(_PKT_MAGIC, 0x16, _POWER_OFF_DATA, _MCU_PAS, b"\x82\x08", pattern, _PKT_TRAILER)
+    for pattern in _PWR_OFF_PATTERNS
+)
+
+# Per-byte decode tables, applied to a whole 8-zone field group with bytes.translate
+_VOLUME_LEVELS: Final = bytes(max(0, v - 1) for v in range(256))  # Stored as (UI_volume + 1)
+_TONE_LEVELS: Final = bytes(v if 0x01 <= v <= 0x19 else 0x0d for v in range(256))  # Out of range -> center
+
+# Balance label per raw byte: 0x01 = MAX Left (-100), 0x1f = Center, 0x3d = MAX Right (+100),
+# intermediate values map linearly to -100..+100, anything else is unknown (None)
+_BALANCE_LABELS: Final = tuple(
+    "MAX Left" if b == 0x01
+    else "Default" if b == 0x1f
+    else "MAX Right" if b == 0x3d
+    else str(int((b - 0x01) / (0x3d - 0x01) * 200) - 100) if 0x01 < b < 0x3d
+    else None
+    for b in range(256)
+)
+
+# Balance device byte per UI value -100..+100, indexed by value + 100
+# -100, 0 and +100 are the exact values from logs, values between are linearly interpolated
+_BALANCE_CODES: Final = tuple(
+    0x01 + int((v + 100) / 100.0 * (0x1f - 0x01)) if v < 0
+    else 0x1f + int(v / 100.0 * (0x3d - 0x1f))
+    for v in range(-100, 101)
+)
+
+def _frame_body(frame: bytes) -> bytes:
+    """Return the 82 [COMMAND] part onward of a framed packet, a bare broadcast is returned as is"""
+    return frame[_CMD_OFFSET - 1:] if frame.startswith(_PKT_MAGIC) else frame
+
 class UniversalHNGSyncDecoder:
     """Universal HNG sync packet decoder that handles both 68-byte and 96-byte packets"""
     
     def __init__(self):
         self.zones = {}
         
-    def decode_hng_sync_packet(self, packet_hex: str, input_mappings: Dict[int, str]) -> Dict[str, Any]:
-        """Decode a complete HNG sync packet - automatically detects packet size"""
-        packet = bytes.fromhex(packet_hex)
+    def decode_hng_sync_packet(
+        self, packet: bytes | str, input_mappings: Dict[int, str], include_raw: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Decode a complete HNG sync packet - automatically detects packet size
+        
+        Args:
+            packet: HNG sync packet as raw bytes or a hex string
+            input_mappings: Device input ID to name mapping
+            include_raw: Add each zone's raw field bytes as hex strings under 'raw_data'
+        """
+        if isinstance(packet, str):
+            packet = bytes.fromhex(packet)
         
         result = {
             'packet_length': len(packet),
@@ -54,102 +244,72 @@ class UniversalHNGSyncDecoder:
             _LOGGER.warning("Unknown packet size %d bytes", len(packet))
             hng_start = 0
         
-        # Decode each zone
-        for zone in range(8):
-            zone_num = zone + 1
-            zone_data = self.decode_zone(zone, packet, hng_start, len(packet), input_mappings)
-            result['zones'][zone_num] = zone_data
+        packet_size = len(packet)
+        
+        # Field offsets only depend on the packet size, pick them once per packet
+        offs = _OFFS96 if packet_size == 96 else _OFFS68
+        starts = [hng_start + o for o in offs]
+        
+        if len(packet) < max(starts) + 8:
+            raise ValueError(f"HNG sync packet too short: {packet_size} bytes")
+        
+        # One 8-byte slice per field group (one byte per zone), indexing a slice gives the raw value
+        inputs, volumes, powers, balances, mutes, basses, trebles = fields = tuple(
+            packet[start:start + 8] for start in starts
+        )
+        
+        # Decode each zone from its column of (input, volume, power, balance, mute, bass, treble)
+        # Numeric fields are decoded for all zones at once
+        columns = zip(
+            inputs, volumes.translate(_VOLUME_LEVELS), powers, balances, mutes,
+            basses.translate(_TONE_LEVELS), trebles.translate(_TONE_LEVELS)
+        )
+        for zone, values in enumerate(columns):
+            raw = bytes(field[zone] for field in fields) if include_raw else None
+            result['zones'][zone + 1] = self.decode_zone(zone, values, packet_size, input_mappings, raw)
         
         return result
     
-    def decode_zone(self, zone: int, packet: bytes, hng_start: int, packet_size: int, input_mappings: Dict[int, str]) -> Dict[str, Any]:
-        """Decode individual zone data based on packet size"""
-        
-        # Input state
-        if packet_size == 96:
-            input_start = hng_start + 2  # bytes 2-9 in HNG section
-        else:  # 68-byte packet
-            input_start = hng_start + 2  # bytes 2-9
-        input_val = packet[input_start + zone]
-        input_name = self.decode_input_selection(input_val, input_mappings)
-        
-        # Volume state
-        if packet_size == 96:
-            volume_start = hng_start + 10  # bytes 10-17 in HNG section
-        else:  # 68-byte packet
-            volume_start = hng_start + 10  # bytes 10-17
-        volume_val = packet[volume_start + zone]
-        volume = self.decode_volume_level(volume_val)
-        
-        # Power state
-        if packet_size == 96:
-            power_start = hng_start + 44  # bytes 44-51 in HNG section
-        else:  # 68-byte packet
-            power_start = hng_start + 50  # bytes 50-57
-        power_val = packet[power_start + zone]
-        power = self.decode_power_state(power_val, packet_size)
-        
-        # Balance state
-        # Confirmed by differential analysis: balance is at position 34 + zone_index
-        balance_start = hng_start + 34
-        balance_val = packet[balance_start + zone]
-        balance = self.decode_balance_state(balance_val, packet_size)
-        
-        # Mute state
-        if packet_size == 96:
-            mute_start = hng_start + 52  # bytes 52-59 in HNG section
-        else:  # 68-byte packet
-            mute_start = hng_start + 28  # bytes 28-35
-        mute_val = packet[mute_start + zone]
-        mute = self.decode_mute_state(mute_val, packet_size)
-        
-        # Bass and treble state - decode from specific byte positions
-        bass, treble = self.decode_bass_treble(zone, packet, hng_start, packet_size)
-        
-        # Get raw bass and treble values for raw_data
-        bass_start = self.get_bass_start(hng_start, packet_size)
-        treble_start = self.get_treble_start(hng_start, packet_size)
-        bass_val = packet[bass_start + zone]
-        treble_val = packet[treble_start + zone]
-        
-        return {
+    def decode_zone(
+        self,
+        zone: int,
+        values: tuple[int, ...],
+        packet_size: int,
+        input_mappings: Dict[int, str],
+        raw: bytes | None = None,
+    ) -> Dict[str, Any]:
+        """Decode individual zone data from its (input, volume, power, balance, mute, bass, treble) values
+        
+        Volume, bass and treble are already translated, raw holds the untranslated bytes in the same order
+        """
+        input_val, volume, power_val, balance_val, mute_val, bass_level, treble_level = values
+        
+        zone_data = {
             'zone_id': zone + 1,
-            'power': power,
-            'input': input_name,
+            'power': self.decode_power_state(power_val, packet_size),
+            'input': self.decode_input_selection(input_val, input_mappings),
             'volume': volume,
-            'balance': balance,
-            'mute': mute,
-            'bass': bass,
-            'treble': treble,
-            'raw_data': {
-                'power': f"0x{power_val:02x}",
-                'input': f"0x{input_val:02x}",
-                'volume': f"0x{volume_val:02x}",
-                'balance': f"0x{balance_val:02x}",
-                'mute': f"0x{mute_val:02x}",
-                'bass': f"0x{bass_val:02x}",
-                'treble': f"0x{treble_val:02x}"
-            }
+            'balance': self.decode_balance_state(balance_val, packet_size),
+            'mute': self.decode_mute_state(mute_val, packet_size),
+            # Bass/treble: 0x0d is center (0), range 0x01 to 0x19
+            'bass': bass_level - 0x0d,
+            'treble': treble_level - 0x0d,
         }
+        if raw is not None:
+            zone_data['raw_data'] = {
+                'power': f"0x{raw[2]:02x}",
+                'input': f"0x{raw[0]:02x}",
+                'volume': f"0x{raw[1]:02x}",
+                'balance': f"0x{raw[3]:02x}",
+                'mute': f"0x{raw[4]:02x}",
+                'bass': f"0x{raw[5]:02x}",
+                'treble': f"0x{raw[6]:02x}"
+            }
+        return zone_data
     
     def decode_power_state(self, power: int, packet_size: int) -> str:
         """Decode zone power state based on packet size"""
-        if packet_size == 96:
-            # 96-byte packet: 0x02=ON, 0x01=OFF
-            if power == 0x02:
-                return "ON"
-            elif power == 0x01:
-                return "OFF"
-            else:
-                return f"UNKNOWN(0x{power:02x})"
-        else:
-            # 68-byte packet: 0x01=ON, 0x02=OFF (with reversed zone mapping)
-            if power == 0x01:
-                return "ON"
-            elif power == 0x02:
-                return "OFF"
-            else:
-                return f"UNKNOWN(0x{power:02x})"
+        return _POWER_STATES[packet_size == 96][power] or f"UNKNOWN(0x{power:02x})"
     
     def decode_input_selection(self, input_val: int, input_mappings: Dict[int, str]) -> str:
         """Decode zone input selection using device-provided input mappings"""
@@ -159,90 +319,26 @@ class UniversalHNGSyncDecoder:
         _LOGGER.debug("Decoding input %d with mappings %s -> %s", input_val, input_mappings, result)
         return result
     
-    def decode_volume_level(self, volume: int) -> int:
-        """Decode zone volume level (with +1 offset)"""
-        # Volume is stored as (UI_volume + 1)
-        ui_volume = volume - 1
-        return max(0, ui_volume)  # Ensure non-negative
-    
     def decode_balance_state(self, balance: int, packet_size: int) -> str:
         """Decode zone balance state based on differential analysis"""
-        # Based on differential analysis, balance values are:
-        # 0x01 = MAX Left (-100), 0x1f = Center (0), 0x3d = MAX Right (+100)
-        if balance == 0x3d:
-            return "MAX Right"
-        elif balance == 0x1f:
-            return "Default"
-        elif balance == 0x01:
-            return "MAX Left"
-        else:
-            # For intermediate values, we need to map them to UI values
-            # The range appears to be 0x01 to 0x3d (1 to 61)
-            if 0x01 <= balance <= 0x3d:
-                # Map 0x01-0x3d to -100 to +100
-                ui_value = int((balance - 0x01) / (0x3d - 0x01) * 200) - 100
-                return str(ui_value)
-            else:
-                return f"UNKNOWN(0x{balance:02x})"
+        return _BALANCE_LABELS[balance] or f"UNKNOWN(0x{balance:02x})"
     
     def decode_mute_state(self, mute: int, packet_size: int) -> str:
         """Decode zone mute state based on packet size"""
-        if packet_size == 96:
-            # 96-byte packet: 0x01=Default, 0x02=Muted
-            if mute == 0x01:
-                return "DEFAULT"
-            elif mute == 0x02:
-                return "MUTED"
-            else:
-                return f"UNKNOWN(0x{mute:02x})"
-        else:
-            # 68-byte packet: 0x0d=Default, 0x02=Muted
-            if mute == 0x0d:
-                return "DEFAULT"
-            elif mute == 0x02:
-                return "MUTED"
-            else:
-                return f"UNKNOWN(0x{mute:02x})"
-
-    
-    def get_bass_start(self, hng_start: int, packet_size: int) -> int:
-        """Get the starting byte position for bass data"""
-        # Confirmed by differential analysis: bass is at position 26 + zone_index
-        return hng_start + 26
-    
-    def get_treble_start(self, hng_start: int, packet_size: int) -> int:
-        """Get the starting byte position for treble data"""
-        # Confirmed by differential analysis: treble is at position 18 + zone_index
-        return hng_start + 18
+        return _MUTE_STATES[packet_size == 96][mute] or f"UNKNOWN(0x{mute:02x})"
     
-    def decode_bass_treble(self, zone: int, packet: bytes, hng_start: int, packet_size: int) -> tuple[int, int]:
-        """Decode bass and treble values from HNG sync packet"""
-        
-        bass_start = self.get_bass_start(hng_start, packet_size)
-        treble_start = self.get_treble_start(hng_start, packet_size)
-        
-        bass_val = packet[bass_start + zone]
-        treble_val = packet[treble_start + zone]
-        
-        # Based on differential analysis:
-        # Bass: 0x0d is center (0), range appears to be 0x01 to 0x19 (1 to 25)
-        # Treble: 0x0d is center (0), range appears to be 0x01 to 0x19 (1 to 25)
-        bass = bass_val - 0x0d if 0x01 <= bass_val <= 0x19 else 0
-        treble = treble_val - 0x0d if 0x01 <= treble_val <= 0x19 else 0
-        
-        return bass, treble
-
 class BroadcastDecoder:
     """Decodes broadcast packets from Matrio device"""
     
     def __init__(self, input_mappings: Dict[int, str]):
         self.input_mappings = input_mappings
         
-    def decode_packet(self, packet_hex: str) -> Optional[Dict[str, Any]]:
-        """Decode any packet - either broadcast or command echo"""
+    def decode_packet(self, packet: bytes | str) -> Optional[Dict[str, Any]]:
+        """Decode any packet - either broadcast or command echo, as raw bytes or a hex string"""
         try:
-            packet = bytes.fromhex(packet_hex)
-            _LOGGER.debug(f"BroadcastDecoder: Attempting to decode packet ({len(packet)} bytes): {packet_hex[:50]}...")
+            if isinstance(packet, str):
+                packet = bytes.fromhex(packet)
+            _LOGGER.debug("BroadcastDecoder: Attempting to decode packet (%d bytes): %s...", len(packet), packet[:25].hex())
             
             # Check if this is a command echo packet (starts with 18961820)
             if len(packet) >= 4 and packet[:4] == b'\x18\x96\x18\x20':
@@ -258,13 +354,13 @@ class BroadcastDecoder:
             return None
                 
         except Exception as e:
-            _LOGGER.error(f"BroadcastDecoder: Failed to decode packet: {e}")
+            _LOGGER.error("BroadcastDecoder: Failed to decode packet: %s", e)
             return None
     
     def _decode_command_echo_packet(self, packet: bytes) -> Optional[Dict[str, Any]]:
         """Decode command echo packet to extract the actual command"""
         try:
-            _LOGGER.debug(f"BroadcastDecoder: Decoding command echo packet ({len(packet)} bytes)")
+            _LOGGER.debug("BroadcastDecoder: Decoding command echo packet (%d bytes)", len(packet))
             
             # Extract payload (skip header + length + data = 20 bytes)
             if len(packet) < 20:
@@ -272,7 +368,7 @@ class BroadcastDecoder:
                 return None
                 
             payload = packet[20:]
-            _LOGGER.debug(f"BroadcastDecoder: Extracted payload ({len(payload)} bytes): {payload.hex()[:50]}...")
+            _LOGGER.debug("BroadcastDecoder: Extracted payload (%d bytes): %s...", len(payload), payload[:25].hex())
             
             # Look for MCU+PAS+ (4d43552b5041532b) + command
             if len(payload) < 10 or payload[:8] != b'MCU+PAS+':
@@ -281,14 +377,14 @@ class BroadcastDecoder:
                 
             # Extract command part (skip MCU+PAS+)
             command_part = payload[8:]
-            _LOGGER.debug(f"BroadcastDecoder: Command part ({len(command_part)} bytes): {command_part.hex()}")
+            _LOGGER.debug("BroadcastDecoder: Command part (%d bytes): %s", len(command_part), command_part.hex())
             
             if len(command_part) < 2:
                 _LOGGER.debug("BroadcastDecoder: Command part too short")
                 return None
                 
             command = command_part[1]  # Skip 0x82, get command
-            _LOGGER.debug(f"BroadcastDecoder: Extracted command: 0x{command:02x}")
+            _LOGGER.debug("BroadcastDecoder: Extracted command: 0x%02x", command)
             
             # Extract the actual broadcast data (skip 0x82 + command)
             if len(command_part) < 10:
@@ -296,15 +392,15 @@ class BroadcastDecoder:
                 return None
                 
             broadcast_data = command_part[2:10]  # 8 bytes: value + zone pattern
-            _LOGGER.debug(f"BroadcastDecoder: Broadcast data: {broadcast_data.hex()}")
+            _LOGGER.debug("BroadcastDecoder: Broadcast data: %s", broadcast_data.hex())
             
             # Decode based on command type
             result = self._decode_command_data(command, broadcast_data)
-            _LOGGER.debug(f"BroadcastDecoder: Command data decode result: {result}")
+            _LOGGER.debug("BroadcastDecoder: Command data decode result: %s", result)
             return result
             
         except Exception as e:
-            _LOGGER.error(f"BroadcastDecoder: Failed to decode command echo packet: {e}")
+            _LOGGER.error("BroadcastDecoder: Failed to decode command echo packet: %s", e)
             return None
     
     def _decode_direct_broadcast_packet(self, packet: bytes) -> Optional[Dict[str, Any]]:
@@ -327,7 +423,7 @@ class BroadcastDecoder:
         value = data[0]
         zone_pattern = data[1:]  # All bytes except the first (value byte) for zones 1-8
         
-        _LOGGER.debug(f"BroadcastDecoder: Command 0x{command:02x}, value 0x{value:02x}, zone_pattern {zone_pattern.hex()}")
+        _LOGGER.debug("BroadcastDecoder: Command 0x%02x, value 0x%02x, zone_pattern %s", command, value, zone_pattern.hex())
         
         # Find which zones are affected (0-based indexing)
         affected_zones = []
@@ -351,12 +447,12 @@ class BroadcastDecoder:
                 if zone_val == 0x01:
                     affected_zones.append(i + 1)  # Convert to 1-based for display
         
-        _LOGGER.debug(f"BroadcastDecoder: Affected zones: {affected_zones}")
+        _LOGGER.debug("BroadcastDecoder: Affected zones: %s", affected_zones)
         
         # Decode based on command type
         if command == 0x08:  # Power command
             power_on = value == 0x02  # 0x02 = ON, 0x01 = OFF
-            _LOGGER.debug(f"BroadcastDecoder: Power command - zones {affected_zones} -> {'ON' if power_on else 'OFF'}")
+            _LOGGER.debug("BroadcastDecoder: Power command - zones %s -> %s", affected_zones, 'ON' if power_on else 'OFF')
             return {
                 "type": "power",
                 "zones": affected_zones,
@@ -367,7 +463,7 @@ class BroadcastDecoder:
             
         elif command == 0x01:  # Volume command
             volume = max(0, value - 1)  # Convert from device value to UI value
-            _LOGGER.debug(f"BroadcastDecoder: Volume command - zones {affected_zones} -> {volume}")
+            _LOGGER.debug("BroadcastDecoder: Volume command - zones %s -> %s", affected_zones, volume)
             return {
                 "type": "volume",
                 "zones": affected_zones,
@@ -378,7 +474,7 @@ class BroadcastDecoder:
             
         elif command == 0x0e:  # Mute command
             is_muted = value == 0x02
-            _LOGGER.debug(f"BroadcastDecoder: Mute command - zones {affected_zones} -> {'MUTED' if is_muted else 'UNMUTED'}")
+            _LOGGER.debug("BroadcastDecoder: Mute command - zones %s -> %s", affected_zones, 'MUTED' if is_muted else 'UNMUTED')
             return {
                 "type": "mute",
                 "zones": affected_zones,
@@ -390,7 +486,7 @@ class BroadcastDecoder:
         elif command == 0x0d:  # Input selection command
             input_id = value
             input_name = self.input_mappings.get(input_id, f"Input {input_id}")
-            _LOGGER.debug(f"BroadcastDecoder: Input command - zones {affected_zones} -> {input_name} (ID: {input_id})")
+            _LOGGER.debug("BroadcastDecoder: Input command - zones %s -> %s (ID: %s)", affected_zones, input_name, input_id)
             return {
                 "type": "input",
                 "zones": affected_zones,
@@ -480,6 +576,20 @@ class MatrioController:
         self.connected = False
         self._reader_task = None
         self._writer_task = None
+        # Serializes request/response exchanges so concurrent callers don't read each other's acks
+        self._io_lock = asyncio.Lock()
+        self._rx_buffer = bytearray()  # Bytes read past the last frame returned by _read_frame
+        # Set while _reader_loop owns the reader, exchanges then get their replies from it
+        self._dispatching = False
+        # (reply 82 [COMMAND], future, frames so far) of the waiting exchange
+        self._pending_reply: tuple[int, asyncio.Future, list[bytes]] | None = None
+        # (82 [COMMAND] onward, expiry) of packets whose exchange timed out before their echo arrived
+        self._late_replies: list[tuple[bytes, float]] = []
+        self._upnp_reader = None
+        self._upnp_writer = None
+        self._local_ip = None
+        self._names_cache: tuple[float, bytes] | None = None  # (monotonic time, ALLNAMES frame)
+        self._hng_inflight: asyncio.Task | None = None  # HNG sync shared by concurrent callers
         
         # Default input mapping based on capture analysis
         self.inputs = {
@@ -496,22 +606,26 @@ class MatrioController:
     def _get_local_ip(self) -> str:
         """
         Get the local IP address of this machine
+        
+        The address found is cached for reconnects; the localhost fallback is not.
         """
+        if self._local_ip:
+            return self._local_ip
         try:
             # Create a socket to determine the local IP
             # Connect to a remote address to determine the local interface
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
                 # Connect to the Matrio device to use the same network interface
                 s.connect((self.ip, 80))
-                local_ip = s.getsockname()[0]
-                return local_ip
+                self._local_ip = s.getsockname()[0]
+                return self._local_ip
         except Exception:
             # Fallback: try to connect to a public DNS server
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
                     s.connect(("8.8.8.8", 80))
-                    local_ip = s.getsockname()[0]
-                    return local_ip
+                    self._local_ip = s.getsockname()[0]
+                    return self._local_ip
             except Exception:
                 # Last resort: return localhost
                 return "127.0.0.1"
@@ -523,6 +637,7 @@ class MatrioController:
             
             # Create connection
             self.reader, self.writer = await asyncio.open_connection(self.ip, self.port)
+            self._rx_buffer.clear()
             _LOGGER.info(f"TCP connection established to {self.ip}:{self.port}")
             _LOGGER.debug(f"Reader: {self.reader}, Writer: {self.writer}")
             
@@ -589,6 +704,8 @@ class MatrioController:
         except Exception as e:
             _LOGGER.error(f"Device initialization failed: {e}")
             return False
+        finally:
+            await self._close_upnp_connection()
     
     async def _reader_loop(self):
         """Reader loop that handles incoming packets and broadcasts"""
@@ -600,30 +717,33 @@ class MatrioController:
             await self._get_initial_state()
             _LOGGER.debug("Initial state retrieval completed")
             
-            # Then listen for broadcast packets
+            # Then listen for broadcast packets, from here on this loop is the only reader
+            # Taking the lock waits out an exchange still reading the connection directly
             _LOGGER.info("Starting broadcast packet listener...")
+            async with self._io_lock:
+                self._dispatching = True
             packet_count = 0
             while self.connected:
                 try:
-                    # Read data with timeout
-                    data = await asyncio.wait_for(self.reader.read(1024), timeout=5.0)
+                    # Read one frame with timeout
+                    data = await self._read_frame(_SYNC_TIMEOUT)
+                    packet_count += 1
                     
-                    if len(data) == 0:
-                        _LOGGER.warning("Connection lost - received empty data")
-                        break
+                    # Hand the frame to a waiting exchange, it is still decoded below
+                    # since command echoes carry state too
+                    self._dispatch_reply(data)
                     
-                    packet_count += 1
                     # Decode the packet
-                    packet_hex = data.hex()
-                    _LOGGER.debug(f"Received packet #{packet_count} ({len(data)} bytes): {packet_hex}")
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Received packet #%d (%d bytes): %s", packet_count, len(data), data.hex())
                     
                     # Try to decode as broadcast packet
                     if self.broadcast_decoder:
                         _LOGGER.debug("Attempting to decode packet as broadcast...")
-                        broadcast_info = self.broadcast_decoder.decode_packet(packet_hex)
+                        broadcast_info = self.broadcast_decoder.decode_packet(data)
                         
                         if broadcast_info:
-                            _LOGGER.debug(f"Successfully decoded broadcast: {broadcast_info}")
+                            _LOGGER.debug("Successfully decoded broadcast: %s", broadcast_info)
                             await self._handle_broadcast(broadcast_info)
                         else:
                             _LOGGER.debug("Packet is not a recognized broadcast packet")
@@ -633,16 +753,22 @@ class MatrioController:
                 except asyncio.TimeoutError:
                     # Timeout is expected, continue listening
                     continue
+                except asyncio.IncompleteReadError:
+                    _LOGGER.warning("Connection lost - received empty data")
+                    break
                 except Exception as e:
                     if self.connected:
-                        _LOGGER.error(f"Error in reader loop: {e}")
+                        _LOGGER.error("Error in reader loop: %s", e)
                     break
                     
         except Exception as e:
-            _LOGGER.error(f"Reader loop failed: {e}")
+            _LOGGER.error("Reader loop failed: %s", e)
         finally:
             _LOGGER.debug("Reader loop ending, setting connected=False")
+            self._dispatching = False
             self.connected = False
+            if self._pending_reply and not self._pending_reply[1].done():
+                self._pending_reply[1].set_exception(ConnectionError("Connection lost"))
     
     async def _writer_loop(self):
         """Writer loop that handles outgoing commands"""
@@ -671,153 +797,6 @@ class MatrioController:
         except Exception as e:
             _LOGGER.error(f"Failed to get initial state: {e}")
     
-    def _parse_allnames_response(self, response: bytes) -> Dict[str, str]:
-        """Parse ALLNAMES response to extract zone and input names"""
-        try:
-            # The ALLNAMES packet structure from packet capture:
-            # Header: 18961820a3000000823400000000000000000000
-            # Payload: 4d43552b5041532b82150b4441582038385f363136450b4c6976696e6720526f6f6d0e4d617374657220426564726f6f6d0d4465636b2055707374616972730f4465636b20446f776e7374616972730a446f776e737461697273065a4f4e453636055a4f4e4537055a4f4e45380254560c476f6f676c65204d7573696306496e7075743306496e7075743406496e7075743507496e707574363606496e70757437cc26
-            
-            # Skip the protocol header and get to the actual data
-            # The payload starts after the protocol header (20 bytes)
-            payload_start = 20
-            if len(response) < payload_start:
-                raise RuntimeError("Response too short to contain ALLNAMES data")
-            
-            # Extract the payload (skip protocol header)
-            payload = response[payload_start:]
-            
-            # The payload structure:
-            # MCU+PAS+ (8 bytes) + 8215 (2 bytes) + length (1 byte) + device_name + zone_names + input_names
-            
-            # The data starts immediately after the protocol header
-            data = payload
-            _LOGGER.debug("ALLNAMES data length: %d bytes", len(data))
-            _LOGGER.debug("ALLNAMES data hex: %s", data.hex()[:200])
-            
-            # Parse length-prefixed strings
-            names = {}
-            pos = 0
-            
-            # Skip MCU+PAS+ (8 bytes) and 8215 command (2 bytes)
-            if len(data) < 10:
-                raise RuntimeError("Data too short for MCU+PAS+ and command")
-            
-            # Verify MCU+PAS+ header
-            if data[0:8] != b'MCU+PAS+':
-                raise RuntimeError("Invalid MCU+PAS+ header")
-            
-            # Verify 8215 command
-            if data[8:10] != b'\x82\x15':
-                raise RuntimeError("Invalid 8215 command")
-            
-            pos = 10  # Skip MCU+PAS+ and 8215 command
-            
-            # First string is device name (length 0x0b = 11 bytes)
-            if pos + 1 > len(data):
-                raise RuntimeError("No device name length found")
-            
-            device_name_len = data[pos]
-            pos += 1
-            _LOGGER.debug("Device name length: %d (0x%02x)", device_name_len, device_name_len)
-            
-            if pos + device_name_len > len(data):
-                raise RuntimeError("Device name extends beyond data")
-            
-            device_name = data[pos:pos + device_name_len].decode('ascii', errors='ignore')
-            pos += device_name_len
-            _LOGGER.debug("Device name: '%s'", device_name)
-            
-            # Parse zone names (8 zones)
-            zone_names = []
-            for zone_id in range(8):
-                if pos >= len(data):
-                    _LOGGER.debug("Reached end of data at zone %d, pos=%d, len=%d", zone_id, pos, len(data))
-                    zone_names.append(f"Zone {zone_id + 1}")  # Add fallback name
-                    continue
-                
-                if pos + 1 > len(data):
-                    _LOGGER.debug("No length byte for zone %d, pos=%d, len=%d", zone_id, pos, len(data))
-                    zone_names.append(f"Zone {zone_id + 1}")  # Add fallback name
-                    continue
-                
-                name_len = data[pos]
-                pos += 1
-                _LOGGER.debug("Zone %d name length: %d (0x%02x), pos=%d", zone_id, name_len, name_len, pos)
-                
-                if pos + name_len > len(data):
-                    _LOGGER.debug("Zone %d name extends beyond data, pos=%d, name_len=%d, data_len=%d", zone_id, pos, name_len, len(data))
-                    zone_names.append(f"Zone {zone_id + 1}")  # Add fallback name
-                    continue
-                
-                zone_name = data[pos:pos + name_len].decode('ascii', errors='ignore')
-                # Truncate to 16 characters if longer
-                if len(zone_name) > 16:
-                    zone_name = zone_name[:16]
-                zone_names.append(zone_name)
-                _LOGGER.debug("Zone %d name: '%s', pos after: %d", zone_id, zone_name, pos + name_len)
-                pos += name_len
-            
-            # Parse input names (8 inputs)
-            input_names = []
-            for input_id in range(8):
-                if pos >= len(data):
-                    _LOGGER.debug("Reached end of data at input %d, pos=%d, len=%d", input_id, pos, len(data))
-                    # If we've reached the end of data, Input 8 is typically "Wi-Fi"
-                    if input_id == 7:  # Input 8 (index 7)
-                        input_names.append("Wi-Fi")
-                    break
-                
-                if pos + 1 > len(data):
-                    _LOGGER.debug("No length byte for input %d, pos=%d, len=%d", input_id, pos, len(data))
-                    # If we can't read the full name, Input 8 is typically "Wi-Fi"
-                    if input_id == 7:  # Input 8 (index 7)
-                        input_names.append("Wi-Fi")
-                    break
-                
-                name_len = data[pos]
-                pos += 1
-                _LOGGER.debug("Input %d name length: %d (0x%02x), pos=%d", input_id, name_len, name_len, pos)
-                
-                if pos + name_len > len(data):
-                    _LOGGER.debug("Input %d name extends beyond data, pos=%d, name_len=%d, data_len=%d", input_id, pos, name_len, len(data))
-                    # If we can't read the full name, Input 8 is typically "Wi-Fi"
-                    if input_id == 7:  # Input 8 (index 7)
-                        input_names.append("Wi-Fi")
-                    break
-                
-                input_name = data[pos:pos + name_len].decode('ascii', errors='ignore')
-                # Truncate to 16 characters if longer
-                if len(input_name) > 16:
-                    input_name = input_name[:16]
-                input_names.append(input_name)
-                _LOGGER.debug("Input %d name: '%s', pos after: %d", input_id, input_name, pos + name_len)
-                pos += name_len
-            
-            # Ensure we have exactly 8 input names (pad with "Wi-Fi" for Input 8 if missing)
-            while len(input_names) < 8:
-                if len(input_names) == 7:  # Input 8 (index 7)
-                    input_names.append("Wi-Fi")
-                else:
-                    input_names.append(f"Input{len(input_names) + 1}")
-            
-            _LOGGER.debug("Parsed zone names: %s", zone_names)
-            _LOGGER.debug("Parsed input names: %s", input_names)
-            
-            # Build the names dictionary
-            for i, zone_name in enumerate(zone_names):
-                names[f"zone_{i}"] = zone_name
-            
-            for i, input_name in enumerate(input_names):
-                names[f"input_{i+1}"] = input_name
-            
-            return names
-            
-        except Exception as e:
-            _LOGGER.error("ALLNAMES parsing failed: %s", e)
-            _LOGGER.debug("Response that failed to parse: %s", response.hex())
-            raise RuntimeError(f"Failed to parse zone/input names from response: {e}")
-    
     async def _handle_broadcast(self, broadcast_info: Dict[str, Any]):
         """Handle broadcast packet and update state"""
         try:
@@ -890,193 +869,276 @@ class MatrioController:
     async def _setup_upnp_subscriptions(self) -> bool:
         """Setup UPnP event subscriptions on port 59152"""
         try:
-            upnp_port = 59152
-            
-            # Subscribe to rendertransport1 events
             local_ip = self._get_local_ip()
-            subscribe_request1 = (
-                "SUBSCRIBE /upnp/event/rendertransport1 HTTP/1.1\r\n"
-                f"Host: {self.ip}:{upnp_port}\r\n"
-                "Content-Length: 0\r\n"
-                "Connection: keep-alive\r\n"
-                "TIMEOUT: Second-1800\r\n"
-                "NT: upnp:event\r\n"
-                "User-Agent: iOS/7.0 UPnP/1.1 UPNPX/1.2.4\r\n"
-                f"CALLBACK: <http://{local_ip}:22809/Event>\r\n"
-                "Accept-Encoding: gzip, deflate\r\n"
-                "\r\n"
-            )
-            
-            reader1, writer1 = await asyncio.open_connection(self.ip, upnp_port)
-            writer1.write(subscribe_request1.encode())
-            await writer1.drain()
-            response1 = await reader1.read(1024)
-            writer1.close()
-            await writer1.wait_closed()
-            
-            # Small delay between subscriptions
-            import time
-            await asyncio.sleep(0.5)
-            
-            # Subscribe to rendercontrol1 events
-            subscribe_request2 = (
-                "SUBSCRIBE /upnp/event/rendercontrol1 HTTP/1.1\r\n"
-                f"Host: {self.ip}:{upnp_port}\r\n"
-                "Content-Length: 0\r\n"
-                "Connection: keep-alive\r\n"
-                "TIMEOUT: Second-1800\r\n"
-                "NT: upnp:event\r\n"
-                "User-Agent: iOS/7.0 UPnP/1.1 UPNPX/1.2.4\r\n"
-                f"CALLBACK: <http://{local_ip}:22809/Event>\r\n"
-                "Accept-Encoding: gzip, deflate\r\n"
-                "\r\n"
-            )
-            
-            reader2, writer2 = await asyncio.open_connection(self.ip, upnp_port)
-            writer2.write(subscribe_request2.encode())
-            await writer2.drain()
-            response2 = await reader2.read(1024)
-            writer2.close()
-            await writer2.wait_closed()
-            
-            await asyncio.sleep(0.5)
-            
-            # Subscribe to PlayQueue1 events
-            subscribe_request3 = (
-                "SUBSCRIBE /upnp/event/PlayQueue1 HTTP/1.1\r\n"
-                f"Host: {self.ip}:{upnp_port}\r\n"
-                "Content-Length: 0\r\n"
-                "Connection: keep-alive\r\n"
-                "TIMEOUT: Second-1800\r\n"
-                "NT: upnp:event\r\n"
-                "User-Agent: iOS/7.0 UPnP/1.1 UPNPX/1.2.4\r\n"
-                f"CALLBACK: <http://{local_ip}:22809/Event>\r\n"
-                "Accept-Encoding: gzip, deflate\r\n"
-                "\r\n"
-            )
-            
-            reader3, writer3 = await asyncio.open_connection(self.ip, upnp_port)
-            writer3.write(subscribe_request3.encode())
-            await writer3.drain()
-            response3 = await reader3.read(1024)
-            writer3.close()
-            await writer3.wait_closed()
+            # Subscriptions are independent, send them concurrently on their own connections
+            await asyncio.gather(*(
+                self._upnp_oneshot_request(_SUBSCRIBE_TMPL % (service, self.ip, _UPNP_PORT, local_ip))
+                for service in ("rendertransport1", "rendercontrol1", "PlayQueue1")
+            ))
             
             return True
             
         except Exception as e:
-            print(f"UPnP subscription failed: {e}")
+            _LOGGER.warning("UPnP subscription failed: %s", e)
             return False
     
     async def _send_soap_commands(self) -> bool:
         """Send required SOAP commands on port 59152"""
         try:
-            upnp_port = 59152
-            
-            # GetControlDeviceInfo
-            soap_request1 = (
-                "POST /upnp/control/rendercontrol1 HTTP/1.1\r\n"
-                f"Host: {self.ip}\r\n"
-                "SOAPACTION: \"urn:schemas-upnp-org:service:RenderingControl:1#GetControlDeviceInfo\"\r\n"
-                "Content-Type: text/xml; charset=\"utf-8\"\r\n"
-                "Content-Length: 325\r\n"
-                "\r\n"
-                "<?xml version=\"1.0\" encoding=\"utf-8\"?><s:Envelope s:encodingStyle=\"http://schemas.xmlsoap.org/soap/encoding/\" xmlns:s=\"http://schemas.xmlsoap.org/soap/envelope/\"><s:Body><u:GetControlDeviceInfo xmlns:u=\"urn:schemas-upnp-org:service:RenderingControl:1\"><InstanceID>0</InstanceID></u:GetControlDeviceInfo></s:Body></s:Envelope>"
-            )
-            
-            reader4, writer4 = await asyncio.open_connection(self.ip, upnp_port)
-            writer4.write(soap_request1.encode())
-            await writer4.drain()
-            response4 = await reader4.read(1024)
-            writer4.close()
-            await writer4.wait_closed()
-            
-            await asyncio.sleep(0.5)
-            
-            # GetInfoEx
-            soap_request2 = (
-                "POST /upnp/control/rendertransport1 HTTP/1.1\r\n"
-                f"Host: {self.ip}\r\n"
-                "SOAPACTION: \"urn:schemas-upnp-org:service:AVTransport:1#GetInfoEx\"\r\n"
-                "Content-Type: text/xml; charset=\"utf-8\"\r\n"
-                "Content-Length: 298\r\n"
-                "\r\n"
-                "<?xml version=\"1.0\" encoding=\"utf-8\"?><s:Envelope s:encodingStyle=\"http://schemas.xmlsoap.org/soap/encoding/\" xmlns:s=\"http://schemas.xmlsoap.org/soap/envelope/\"><s:Body><u:GetInfoEx xmlns:u=\"urn:schemas-upnp-org:service:AVTransport:1\"><InstanceID>0</InstanceID></u:GetInfoEx></s:Body></s:Envelope>"
-            )
-            
-            reader5, writer5 = await asyncio.open_connection(self.ip, upnp_port)
-            writer5.write(soap_request2.encode())
-            await writer5.drain()
-            response5 = await reader5.read(1024)
-            writer5.close()
-            await writer5.wait_closed()
-            
-            await asyncio.sleep(0.5)
-            
-            # GetChannel
-            soap_request3 = (
-                "POST /upnp/control/rendercontrol1 HTTP/1.1\r\n"
-                f"Host: {self.ip}\r\n"
-                "SOAPACTION: \"urn:schemas-upnp-org:service:RenderingControl:1#GetChannel\"\r\n"
-                "Content-Type: text/xml; charset=\"utf-8\"\r\n"
-                "Content-Length: 330\r\n"
-                "\r\n"
-                "<?xml version=\"1.0\" encoding=\"utf-8\"?><s:Envelope s:encodingStyle=\"http://schemas.xmlsoap.org/soap/encoding/\" xmlns:s=\"http://schemas.xmlsoap.org/soap/envelope/\"><s:Body><u:GetChannel xmlns:u=\"urn:schemas-upnp-org:service:RenderingControl:1\"><InstanceID>0</InstanceID><Channel>Master</Channel></u:GetChannel></s:Body></s:Envelope>"
-            )
-            
-            reader6, writer6 = await asyncio.open_connection(self.ip, upnp_port)
-            writer6.write(soap_request3.encode())
-            await writer6.drain()
-            response6 = await reader6.read(1024)
-            writer6.close()
-            await writer6.wait_closed()
+            for path, action, body in _SOAP_COMMANDS:
+                try:
+                    await self._upnp_request(_SOAP_TMPL % (path, self.ip, action, len(body), body))
+                except (TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+                    # The request went out, only its reply is missing or unusable
+                    _LOGGER.debug("No usable reply to SOAP %s: %r", action, e)
             
             return True
             
         except Exception as e:
-            print(f"SOAP commands failed: {e}")
+            _LOGGER.warning("SOAP commands failed: %s", e)
             return False
     
+    async def _read_frame(self, timeout: float = _ACK_TIMEOUT) -> bytes:
+        """
+        Read one complete protocol frame from the device connection
+        
+        Frames carry the number of bytes following the 20-byte header in a
+        little-endian length field, so an ack split across TCP segments is read
+        in full and nothing is left behind for the next command. Bytes that are
+        read past the frame stay buffered for the next call.
+        """
+        async with asyncio.timeout(timeout):
+            while (frame := self._next_frame()) is None:
+                data = await self.reader.read(1024)
+                if not data:
+                    if not self._rx_buffer:
+                        raise asyncio.IncompleteReadError(b"", None)
+                    # Connection closed, hand out whatever is left
+                    frame = bytes(self._rx_buffer)
+                    self._rx_buffer.clear()
+                    return frame
+                self._rx_buffer += data
+            return frame
+    
+    def _next_frame(self) -> bytes | None:
+        """Split the next frame off the receive buffer, None until one is complete"""
+        buf = self._rx_buffer
+        if len(buf) < 8 and _PKT_MAGIC.startswith(buf[:4]):
+            return None  # Nothing buffered, or a header still arriving
+        length = int.from_bytes(buf[4:8], "little")
+        if not buf.startswith(_PKT_MAGIC) or length > _MAX_FRAME_LEN:
+            # Unframed data (e.g. a bare 82 broadcast) or garbage, resync on the next magic
+            end = buf.find(_PKT_MAGIC, 1)
+            if end < 0:
+                # Hold back a magic split across reads
+                end = len(buf) - next((k for k in (3, 2, 1) if buf.endswith(_PKT_MAGIC[:k])), 0)
+        else:
+            end = 20 + length
+            if length == _HNG_DECLARED_LEN and buf[_CMD_OFFSET - 1:_CMD_OFFSET + 1] == b"\x82\x0c":
+                # A 0x0c sync frame may carry one byte less than it declares, it ends at its trailer
+                if buf[end - 3:end - 1] == _PKT_TRAILER[1:]:
+                    end -= 1
+            if len(buf) < end:
+                return None
+        frame = bytes(buf[:end])
+        del buf[:end]
+        return frame
+    
+    async def _exchange(self, packet: bytes) -> bytes:
+        """Send a packet and read the reply frame carrying its 82 [COMMAND], one exchange at a time"""
+        return (await self._exchange_until(packet, _frame_body(packet)[1], _ACK_TIMEOUT))[-1]
+    
+    async def _exchange_until(self, packet: bytes, command: int, timeout: float = _SYNC_TIMEOUT) -> list[bytes]:
+        """Send a packet and read reply frames through the one carrying the given 82 [COMMAND]"""
+        async with self._io_lock:
+            if not self._dispatching:
+                self.writer.write(packet)
+                await self.writer.drain()
+                return await self._read_frames_until(command, timeout)
+            return await self._await_reply(packet, command, timeout)
+    
+    async def _await_reply(self, packet: bytes, command: int, timeout: float) -> list[bytes]:
+        """Send a packet and wait for _reader_loop to hand over its reply frames, called with _io_lock held"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending_reply = (command, future, [])
+        try:
+            self.writer.write(packet)
+            await self.writer.drain()
+            async with asyncio.timeout(timeout):
+                return await future
+        except TimeoutError:
+            # An echo of the packet arriving late must not answer the next exchange
+            self._late_replies.append((_frame_body(packet), time.monotonic() + _SYNC_TIMEOUT))
+            raise
+        finally:
+            self._pending_reply = None
+    
+    def _dispatch_reply(self, frame: bytes) -> None:
+        """Collect a frame read by _reader_loop for the waiting exchange, if any"""
+        body = _frame_body(frame)
+        if self._late_replies and self._is_late_reply(body):
+            return
+        if self._pending_reply is None:
+            return
+        command, future, frames = self._pending_reply
+        if future.done():
+            return
+        frames.append(frame)
+        if body[:2] == bytes((0x82, command)):
+            future.set_result(frames)
+    
+    def _is_late_reply(self, body: bytes) -> bool:
+        """Consume the echo of a packet whose exchange timed out, True if body is one"""
+        now = time.monotonic()
+        self._late_replies = [late for late in self._late_replies if late[1] > now]
+        for i, (late_body, _) in enumerate(self._late_replies):
+            if late_body == body:
+                del self._late_replies[i]
+                return True
+        return False
+    
+    async def _read_frames_until(self, command: int, timeout: float = _SYNC_TIMEOUT) -> list[bytes]:
+        """
+        Read whole frames until one carrying the given 82 [COMMAND] arrives
+        
+        Returns every frame read, in order, ending with the matching one, so
+        replies split or coalesced across TCP segments are all seen intact.
+        """
+        marker = bytes((0x82, command))
+        frames = []
+        async with asyncio.timeout(timeout):
+            while True:
+                frame = await self._read_frame(timeout)
+                frames.append(frame)
+                if _frame_body(frame)[:2] == marker:
+                    return frames
+    
+    async def _upnp_request(self, request: str) -> bytes:
+        """Send an HTTP request to the UPnP port, reusing the keep-alive connection"""
+        for _ in range(2):
+            reused = self._upnp_writer is not None
+            if not reused:
+                self._upnp_reader, self._upnp_writer = await asyncio.open_connection(self.ip, _UPNP_PORT)
+            try:
+                self._upnp_writer.write(request.encode())
+                await self._upnp_writer.drain()
+                response, keep_alive = await self._read_http_response(self._upnp_reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self._close_upnp_connection()
+                if not reused:
+                    raise
+                # Device dropped the idle connection, retry once on a fresh one
+                continue
+            except (TimeoutError, asyncio.LimitOverrunError):
+                # Position in the stream is unknown, never reuse it
+                await self._close_upnp_connection()
+                raise
+            if not keep_alive:
+                await self._close_upnp_connection()
+            return response
+        raise ConnectionError("UPnP connection closed by device")
+    
+    async def _upnp_oneshot_request(self, request: str) -> bytes:
+        """Send an HTTP request to the UPnP port on a dedicated connection"""
+        reader, writer = await asyncio.open_connection(self.ip, _UPNP_PORT)
+        try:
+            writer.write(request.encode())
+            await writer.drain()
+            try:
+                response, _ = await self._read_http_response(reader)
+            except asyncio.IncompleteReadError as e:
+                # Connection is closed right after, a short reply is all there is
+                return e.partial
+            except (TimeoutError, asyncio.LimitOverrunError) as e:
+                # The request went out, a missing or oversized reply doesn't fail it
+                _LOGGER.debug("No usable UPnP reply: %r", e)
+                return b""
+            return response
+        finally:
+            writer.close()
+            await writer.wait_closed()
+    
+    async def _read_http_response(self, reader: asyncio.StreamReader) -> tuple[bytes, bool]:
+        """
+        Read one HTTP/1.1 response from the UPnP port
+        
+        Returns:
+            The raw response and whether the connection can be reused
+        
+        Raises:
+            TimeoutError: No complete response within _ACK_TIMEOUT seconds
+        """
+        async with asyncio.timeout(_ACK_TIMEOUT):
+            head = await reader.readuntil(b"\r\n\r\n")
+            status_line, *headers = head.split(b"\r\n")
+            if not status_line.startswith(b"HTTP/1."):
+                # Not an HTTP response, the stream can't be trusted for the next request
+                _LOGGER.debug("Unexpected UPnP response: %r", status_line)
+                return head, False
+            if status_line[9:10] != b"2":
+                _LOGGER.debug("UPnP request returned %s", status_line.decode(errors="replace"))
+            
+            content_length = None
+            keep_alive = True
+            for line in headers:
+                name, _, value = line.partition(b":")
+                name = name.strip().lower()
+                if name == b"content-length":
+                    try:
+                        content_length = int(value)
+                    except ValueError:
+                        return head, False
+                elif name == b"connection" and value.strip().lower() == b"close":
+                    keep_alive = False
+            
+            if content_length is None or content_length < 0:
+                # No framing to find the end of the body, don't reuse the connection
+                return head, False
+            return head + await reader.readexactly(content_length), keep_alive
+    
+    async def _close_upnp_connection(self):
+        """Close the keep-alive UPnP connection if one is open"""
+        writer = self._upnp_writer
+        self._upnp_reader = None
+        self._upnp_writer = None
+        if writer:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+    
     async def _send_binary_initialization(self) -> bool:
         """Send binary protocol initialization sequence"""
         try:
-            # Send initialization command (0x0a)
-            init_packet = bytes.fromhex("189618200f0000005706000000000000000000004d43552b5041532b820affffff8926")
-            self.writer.write(init_packet)
-            await self.writer.drain()
-            
-            # Wait for HNG_SYNC_COMMAND response
-            sync_response = await asyncio.wait_for(self.reader.read(1024), timeout=5.0)
-            if len(sync_response) == 0:
-                return False
-            
-            # Wait for ALLNAMES response
-            allnames_response = await asyncio.wait_for(self.reader.read(1024), timeout=5.0)
-            if len(allnames_response) == 0:
-                return False
+            # Send initialization command (0x0a) and read the HNG_SYNC_COMMAND
+            # response through to the ALLNAMES (0x15) frame
+            frames = await self._exchange_until(_INIT_PACKET, 0x15)
+            allnames_response = frames[-1]
+            self._names_cache = (time.monotonic(), allnames_response)
             
             # Parse ALLNAMES response to get device names immediately
             try:
                 _LOGGER.debug("ALLNAMES response length: %d bytes", len(allnames_response))
                 _LOGGER.debug("ALLNAMES response hex: %s", allnames_response.hex()[:100])
                 
-                allnames_data = self._parse_allnames_response(allnames_response)
+                allnames_data = self._names_from_allnames(allnames_response)
                 _LOGGER.info("Parsed ALLNAMES data: %s", allnames_data)
                 
-                # Update input mappings with actual device names
+                # Update input mappings with actual device names, truncated to 16 characters
                 for i in range(1, 9):
                     input_key = f"input_{i}"
                     if input_key in allnames_data:
-                        self.inputs[i] = allnames_data[input_key]
-                        _LOGGER.debug("Updated input %d: %s", i, allnames_data[input_key])
+                        self.inputs[i] = allnames_data[input_key][:16]
+                        _LOGGER.debug("Updated input %d: %s", i, self.inputs[i])
                 
-                # Store zone names
+                # Store zone names, zones missing from the frame keep their default name
                 self.zone_names = {}
                 for i in range(8):
                     zone_key = f"zone_{i}"
                     if zone_key in allnames_data:
-                        self.zone_names[i+1] = allnames_data[zone_key]
-                        _LOGGER.debug("Updated zone %d: %s", i+1, allnames_data[zone_key])
+                        self.zone_names[i+1] = allnames_data[zone_key][:16]
+                        _LOGGER.debug("Updated zone %d: %s", i+1, self.zone_names[i+1])
                         
             except Exception as e:
                 _LOGGER.warning("Failed to parse ALLNAMES response: %s", e)
@@ -1086,16 +1148,16 @@ class MatrioController:
             
             # Extract HNG sync data from the combined responses (like broadcast decoder)
             _LOGGER.debug("Extracting HNG sync data from combined responses...")
-            combined_data = sync_response + allnames_response
+            combined_data = b"".join(frames)
             _LOGGER.debug("Combined data: %d bytes", len(combined_data))
             
             # Extract HNG sync packet from the combined data
-            hng_hex = self._extract_hng_sync_packet(combined_data)
-            if hng_hex:
-                _LOGGER.debug("Extracted HNG sync packet: %d bytes", len(hng_hex) // 2)
+            hng_packet = self._extract_hng_sync_packet(combined_data)
+            if hng_packet:
+                _LOGGER.debug("Extracted HNG sync packet: %d bytes", len(hng_packet))
                 
                 # Decode the HNG sync packet to get initial zone states
-                result = self.hng_decoder.decode_hng_sync_packet(hng_hex, self.inputs)
+                result = self.hng_decoder.decode_hng_sync_packet(hng_packet, self.inputs)
                 
                 if result and 'zones' in result:
                     self.zones = result['zones']
@@ -1168,41 +1230,21 @@ class MatrioController:
             _LOGGER.debug("No writer connection available")
             return False
         
-        if zone_id < 1 or zone_id > 8:
-            _LOGGER.debug("Invalid zone ID: %s. Must be 1-8", zone_id)
-            return False
-        
-        if input_id < 1 or input_id > 8:
-            _LOGGER.debug("Invalid input ID: %s. Must be 1-8", input_id)
-            return False
-        
-        # Create zone pattern: 01 at target zone position, 02 elsewhere
-        # Pattern is 8 bytes: 0202010202020202 for zone 3, 0202020102020202 for zone 4, etc.
-        zone_pattern = [0x02] * 8
-        zone_pattern[zone_id - 1] = 0x01  # zone_id is 1-based, array is 0-based
-        
-        _LOGGER.debug("Zone pattern: %s", [hex(b) for b in zone_pattern])
-        
         # Protocol format based on capture analysis:
         # Header (4 bytes) + Length (4 bytes) + Data (12 bytes) + Payload
-        header = bytes.fromhex("18961820")
-        length = 22  # 22 bytes total
-        data = bytes.fromhex("b60400000000000000000000")  # Fixed data
-        payload = bytes.fromhex("4d43552b5041532b") + bytes([0x82, 0x0d, input_id]) + bytes(zone_pattern) + bytes.fromhex("ffcc26")
-        
-        packet = header + length.to_bytes(4, 'little') + data + payload
+        # Zone pattern: 01 at target zone position, 02 elsewhere
+        # Pattern is 8 bytes: 0202010202020202 for zone 3, 0202020102020202 for zone 4, etc.
+        packet = bytearray(_INPUT_TEMPLATE)
+        packet[_CMD_VALUE_OFFSET] = input_id
+        packet[_CMD_ZONE_OFFSET + zone_id - 1] = 0x01  # zone_id is 1-based
         
         _LOGGER.debug("Sending packet: %s", packet.hex())
         _LOGGER.debug("Packet length: %s bytes", len(packet))
         
         try:
-            self.writer.write(packet)
-            await self.writer.drain()
+            response = await self._exchange(packet)
             _LOGGER.debug("Sent packet to device")
             
-            # Wait for response
-            response = await asyncio.wait_for(self.reader.read(1024), timeout=2.0)
-            
             if len(response) > 0:
                 _LOGGER.debug("Received response: %s...", response.hex()[:50])
                 return True
@@ -1224,48 +1266,25 @@ class MatrioController:
         if not self.writer:
             return False
         
-        if zone_id < 1 or zone_id > 8:
-            print(f"Invalid zone ID: {zone_id}. Must be 1-8")
-            return False
-        
         try:
             if power_on:
                 # Power ON: Use ab04 command with shifted pattern (02 + zone pattern + 02)
-                command_code = "ab04"
-                # Create shifted pattern: 02 + [zone pattern] + 02 (11 bytes total)
-                zone_pattern = [0x02] * 11  # Start with all 02s
-                zone_pattern[zone_id] = 0x01  # Set target zone to 01
-                pattern_hex = ''.join(f'{b:02x}' for b in zone_pattern)
-                length = 0x18  # 24 bytes total
+                packet = _PWR_ON_PACKETS[zone_id - 1]
             else:
                 # Power OFF: Use aa04 command with dual pattern (01 at position 0 + 01 at target zone)
-                command_code = "aa04"
-                # Create dual pattern: 01 at position 0 + 01 at target zone (9 bytes total)
-                zone_pattern = [0x02] * 9  # Start with all 02s
-                zone_pattern[0] = 0x01  # Always 01 at position 0
-                zone_pattern[zone_id] = 0x01  # 01 at target zone position (zone_id is 1-based, array is 0-based)
-                pattern_hex = ''.join(f'{b:02x}' for b in zone_pattern)
-                length = 0x16  # 22 bytes total
-            
-            # Create packet
-            packet_hex = f"18961820{length:02x}000000{command_code}000000000000000000004d43552b5041532b8208{pattern_hex}ffcc26"
-            packet = bytes.fromhex(packet_hex)
+                packet = _PWR_OFF_PACKETS[zone_id - 1]
             
-            self.writer.write(packet)
-            await self.writer.drain()
-            
-            # Wait for response
-            response = await asyncio.wait_for(self.reader.read(1024), timeout=2.0)
+            response = await self._exchange(packet)
             
             if len(response) > 0:
-                print(f"Zone {zone_id} power {'ON' if power_on else 'OFF'} command sent successfully")
+                _LOGGER.debug("Zone %s power %s command sent successfully", zone_id, 'ON' if power_on else 'OFF')
                 return True
             else:
-                print(f"Zone {zone_id} power {'ON' if power_on else 'OFF'} command failed - no response")
+                _LOGGER.debug("Zone %s power %s command failed - no response", zone_id, 'ON' if power_on else 'OFF')
                 return False
                 
         except Exception as e:
-            print(f"Power command failed: {e}")
+            _LOGGER.warning("Power command failed: %s", e)
             return False
     
     async def _send_volume_command(self, zone_id: int, volume: int) -> bool:
@@ -1279,50 +1298,29 @@ class MatrioController:
         if not self.writer:
             return False
         
-        if zone_id < 1 or zone_id > 8:
-            print(f"Invalid zone ID: {zone_id}. Must be 1-8")
-            return False
-        
-        if volume < 0 or volume > 38:
-            print(f"Invalid volume: {volume}. Must be 0-38")
-            return False
-        
         try:
-            # Create zone-specific pattern: [volume] + zone pattern
-            # Zone pattern has 01 at position (zone_id - 1), 02 elsewhere
-            zone_pattern = [0x02] * 8
-            zone_pattern[zone_id - 1] = 0x01  # zone_id is 1-based, array is 0-based
-            zone_pattern_hex = ''.join(f'{b:02x}' for b in zone_pattern)
-            
             # Volume value needs to be adjusted by +1 (UI shows volume-1)
             # Volume 0 might not work, so we'll use 1 as minimum
             adjusted_volume = max(1, volume + 1)
             
             # Pattern format: [adjusted_volume] + zone_pattern (8 bytes)
-            pattern = f"{adjusted_volume:02x}{zone_pattern_hex}"
-            
-            # Use the working command code from packet capture (b604 works for all volume levels)
-            command_code = "b604"
-            
-            # Create packet using exact format from packet capture
-            packet_hex = f"1896182016000000{command_code}000000000000000000004d43552b5041532b8201{pattern}ffcc26"
-            packet = bytes.fromhex(packet_hex)
-            
-            self.writer.write(packet)
-            await self.writer.drain()
+            # Zone pattern has 01 at position (zone_id - 1), 02 elsewhere
+            # Uses the working command code from packet capture (b604 works for all volume levels)
+            packet = bytearray(_VOL_TEMPLATE)
+            packet[_CMD_VALUE_OFFSET] = adjusted_volume
+            packet[_CMD_ZONE_OFFSET + zone_id - 1] = 0x01  # zone_id is 1-based
             
-            # Wait for response
-            response = await asyncio.wait_for(self.reader.read(1024), timeout=2.0)
+            response = await self._exchange(packet)
             
             if len(response) > 0:
-                print(f"Zone {zone_id} volume: {volume}")
+                _LOGGER.debug("Zone %s volume: %s", zone_id, volume)
                 return True
             else:
-                print(f"Zone {zone_id} volume command failed - no response")
+                _LOGGER.debug("Zone %s volume command failed - no response", zone_id)
                 return False
                 
         except Exception as e:
-            print(f"Volume command failed: {e}")
+            _LOGGER.warning("Volume command failed: %s", e)
             return False
     
     async def _send_mute_command(self, zone_id: int, mute: bool) -> bool:
@@ -1336,46 +1334,28 @@ class MatrioController:
         if not self.writer:
             return False
         
-        if zone_id < 1 or zone_id > 8:
-            print(f"Invalid zone ID: {zone_id}. Must be 1-8")
-            return False
-        
         try:
-            # Create zone-specific pattern: [state] + zone pattern
+            # Pattern format: [state] + zone pattern
             # Zone pattern has 01 at position (zone_id - 1), 02 elsewhere
-            # But mute commands use different indexing - they seem to be off by one
-            zone_pattern = [0x02] * 8
-            zone_pattern[zone_id - 1] = 0x01  # zone_id is 1-based, array is 0-based
-            zone_pattern_hex = ''.join(f'{b:02x}' for b in zone_pattern)
-            
             if mute:
                 # Mute ON: b104 with pattern [02] + zone_pattern
-                command_code = "b104"
-                pattern = f"02{zone_pattern_hex}"
+                packet = bytearray(_MUTE_ON_TEMPLATE)
             else:
                 # Mute OFF: b004 with pattern [01] + zone_pattern
-                command_code = "b004"
-                pattern = f"01{zone_pattern_hex}"
-            
-            # Create packet using exact format from packet capture
-            packet_hex = f"1896182016000000{command_code}000000000000000000004d43552b5041532b820e{pattern}ffcc26"
-            packet = bytes.fromhex(packet_hex)
-            
-            self.writer.write(packet)
-            await self.writer.drain()
+                packet = bytearray(_MUTE_OFF_TEMPLATE)
+            packet[_CMD_ZONE_OFFSET + zone_id - 1] = 0x01  # zone_id is 1-based
             
-            # Wait for response
-            response = await asyncio.wait_for(self.reader.read(1024), timeout=2.0)
+            response = await self._exchange(packet)
             
             if len(response) > 0:
-                print(f"Zone {zone_id} mute: {'ON' if mute else 'OFF'}")
+                _LOGGER.debug("Zone %s mute: %s", zone_id, 'ON' if mute else 'OFF')
                 return True
             else:
-                print(f"Zone {zone_id} mute command failed - no response")
+                _LOGGER.debug("Zone %s mute command failed - no response", zone_id)
                 return False
                 
         except Exception as e:
-            print(f"Mute command failed: {e}")
+            _LOGGER.warning("Mute command failed: %s", e)
             return False
     
     async def _send_name_command(self, command_type: int, item_id: int, name: str) -> bool:
@@ -1398,60 +1378,57 @@ class MatrioController:
         packet = bytes([0x82, 0x13, command_type, item_id, name_length] + list(name_bytes) + [0xcc])
         
         try:
-            self.writer.write(packet)
-            await self.writer.drain()
-            # Wait for response
-            response = await asyncio.wait_for(self.reader.read(1024), timeout=2.0)
+            response = await self._exchange(packet)
+            # Names changed, the next query has to ask the device again
+            self._names_cache = None
             return len(response) > 0
         except Exception as e:
-            print(f"Name command failed: {e}")
+            _LOGGER.warning("Name command failed: %s", e)
             return False
     
     
     # Zone and Input Naming
     async def set_zone_name(self, zone_id: int, name: str) -> bool:
         """Set zone name (zones 1-8)"""
-        if zone_id < 1 or zone_id > 8:
-            print(f"Invalid zone ID: {zone_id}. Must be 1-8")
-            return False
+        if zone_id not in _VALID_IDS:
+            raise ValueError(f"Invalid zone ID: {zone_id}. Must be 1-8")
         result = await self._send_name_command(0x01, zone_id, name)
         if result:
-            print(f"Zone {zone_id} renamed to: {name}")
+            _LOGGER.debug("Zone %s renamed to: %s", zone_id, name)
         return result
     
     async def set_input_name(self, input_id: int, name: str) -> bool:
         """Set input name (inputs 1-8)"""
-        if input_id < 1 or input_id > 8:
-            print(f"Invalid input ID: {input_id}. Must be 1-8")
-            return False
+        if input_id not in _VALID_IDS:
+            raise ValueError(f"Invalid input ID: {input_id}. Must be 1-8")
         result = await self._send_name_command(0x02, input_id, name)
         if result:
-            print(f"Input {input_id} renamed to: {name}")
+            _LOGGER.debug("Input %s renamed to: %s", input_id, name)
         return result
     
     # Individual Zone Controls
     async def set_zone_power(self, zone_id: int, power: bool) -> bool:
         """Turn individual zone on/off using the correct protocol"""
+        if zone_id not in _VALID_IDS:
+            raise ValueError(f"Invalid zone ID: {zone_id}. Must be 1-8")
         return await self._send_power_command(zone_id, power)
     
     async def set_volume(self, zone_id: int, volume: int) -> bool:
         """Set volume for individual zone (0-38) using correct protocol"""
-        if zone_id < 1 or zone_id > 8:
-            print(f"Invalid zone ID: {zone_id}. Must be 1-8")
-            return False
+        if zone_id not in _VALID_IDS:
+            raise ValueError(f"Invalid zone ID: {zone_id}. Must be 1-8")
         
         # Volume range matches mobile app: 0-38
         if volume < 0 or volume > 38:
-            print(f"Invalid volume: {volume}. Must be 0-38")
+            _LOGGER.debug("Invalid volume: %s. Must be 0-38", volume)
             return False
         
         return await self._send_volume_command(zone_id, volume)
     
     async def set_mute(self, zone_id: int, mute: bool) -> bool:
         """Mute/unmute individual zone using correct protocol"""
-        if zone_id < 1 or zone_id > 8:
-            print(f"Invalid zone ID: {zone_id}. Must be 1-8")
-            return False
+        if zone_id not in _VALID_IDS:
+            raise ValueError(f"Invalid zone ID: {zone_id}. Must be 1-8")
         
         return await self._send_mute_command(zone_id, mute)
     
@@ -1460,9 +1437,10 @@ class MatrioController:
         """Set input for individual zone (1-8)"""
         _LOGGER.debug("set_input called: zone_id=%s, input_id=%s", zone_id, input_id)
         
-        if input_id < 1 or input_id > 8:
-            _LOGGER.debug("Invalid input ID: %s. Must be 1-8", input_id)
-            return False
+        if zone_id not in _VALID_IDS:
+            raise ValueError(f"Invalid zone ID: {zone_id}. Must be 1-8")
+        if input_id not in _VALID_IDS:
+            raise ValueError(f"Invalid input ID: {input_id}. Must be 1-8")
         
         input_name = self.inputs.get(input_id, f"Input {input_id}")
         _LOGGER.debug("Attempting to set Zone %s to %s (ID: %s)", zone_id, input_name, input_id)
@@ -1507,25 +1485,11 @@ class MatrioController:
             # Data: varies (12 bytes)
             # Payload: MCU+PAS+ + command + data
             
-            if command == 0x0a:  # First command (10 bytes)
-                length = 0x0f  # 15 bytes total
-                data = bytes.fromhex("570600000000000000000000")
-                payload = bytes.fromhex("4d43552b5041532b820affffff8926")
-            elif command == 0x0c:  # Second command (12 bytes) 
-                length = 0x4c  # 76 bytes total
-                data = bytes.fromhex("a90800000000000000000000")
-                payload = bytes.fromhex("4d43552b5041532b820c0108080808080808070f22171d0805050d0d0d0d0d0d0d0d0d0d0d0d0d0d0d1f1f1f1f1f1f1f1f02010201010101010101010102010101010140180c14ffffcc26")
-            else:
-                print(f"Unknown command: 0x{command:02x}")
+            packet = _PROTO_PACKETS.get(command)
+            if packet is None:
+                _LOGGER.debug("Unknown command: 0x%02x", command)
                 return None
             
-            # Construct packet
-            header = bytes.fromhex("18961820")
-            packet = header + length.to_bytes(4, 'little') + data + payload
-            
-            self.writer.write(packet)
-            await self.writer.drain()
-            
             # For the sequence, we need to handle the protocol flow:
             # 1. Send 0x0a command
             # 2. Receive ACK
@@ -1534,28 +1498,17 @@ class MatrioController:
             # 5. Receive ALLNAMES (0x15) packet
             
             if command == 0x0a:
-                # Send first command and wait for responses
-                
-                # Wait for ACK
-                ack = await asyncio.wait_for(self.reader.read(1024), timeout=5.0)
-                if len(ack) == 0:
-                    print("Received ACK")
-                
-                # Wait for 0x0c response (this is actually the ALLNAMES packet)
-                response = await asyncio.wait_for(self.reader.read(1024), timeout=5.0)
-                if len(response) > 0:
-                    print(f"Received response: {len(response)} bytes")
-                    # This is the ALLNAMES packet, return it directly
-                    return response
-                
-                return None
+                # Read the ACK and 0x0c response through to the ALLNAMES packet, return it directly
+                response = (await self._exchange_until(packet, 0x15))[-1]
+                _LOGGER.debug("Received response: %d bytes", len(response))
+                return response
             else:
                 # For other commands, just send and receive
-                response = await asyncio.wait_for(self.reader.read(1024), timeout=2.0)
+                response = await self._exchange(packet)
                 return response if len(response) > 0 else None
                 
         except Exception as e:
-            print(f"Protocol command failed: {e}")
+            _LOGGER.warning("Protocol command failed: %s", e)
             return None
     
     async def check_heartbeat(self) -> bool:
@@ -1573,6 +1526,57 @@ class MatrioController:
         except Exception:
             return False
     
+    async def _get_allnames_frame(self) -> bytes:
+        """Return the ALLNAMES frame, asking the device at most every _NAMES_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._names_cache and now - self._names_cache[0] < _NAMES_CACHE_TTL:
+            return self._names_cache[1]
+        
+        # Send the first command (0x0a) to trigger the protocol sequence that returns ALLNAMES
+        response = await self._send_protocol_command(0x0a)
+        if not response:
+            raise RuntimeError("Device did not respond to ALLNAMES command")
+        self._names_cache = (now, response)
+        return response
+    
+    def _split_allnames(self, response: bytes) -> tuple[bytes, List[bytes], List[bytes]]:
+        """
+        Split an ALLNAMES frame into the device name, zone names and input names
+        
+        Names are returned as raw bytes. A frame that ends early yields fewer
+        zone/input names, a missing or truncated device name raises IndexError.
+        """
+        # Reject anything that is not an MCU+PAS+ 82 15 frame before decoding
+        if response[_ALLNAMES_HDR_LEN:_ALLNAMES_HDR_LEN + 8] != _MCU_PAS:
+            raise RuntimeError("Invalid MCU+PAS+ header")
+        if response[_ALLNAMES_HDR_LEN + 8:_ALLNAMES_DATA_OFFSET] != b"\x82\x15":
+            raise RuntimeError("Invalid 8215 command")
+        
+        # View past the protocol header, MCU+PAS+ and command without copying
+        data = memoryview(response)[_ALLNAMES_DATA_OFFSET:]
+        
+        # Parse length-prefixed strings. Indexing past the end of the frame
+        # raises IndexError, so the success path needs no bounds checks:
+        # reading the last byte of each name catches a truncated string.
+        device_name_len = data[0]
+        data[device_name_len]
+        device_name = bytes(data[1:1 + device_name_len])
+        pos = 1 + device_name_len
+        
+        # 8 zone names followed by 8 input names
+        names: List[bytes] = []
+        try:
+            for _ in range(16):
+                name_len = data[pos]
+                data[pos + name_len]
+                names.append(bytes(data[pos + 1:pos + 1 + name_len]))
+                pos += 1 + name_len
+        except IndexError:
+            # Frame ended early
+            pass
+        
+        return device_name, names[:8], names[8:]
+    
     async def query_device_info(self) -> Dict[str, str]:
         """
         Query device information from the Matrio-compatible device using the correct protocol
@@ -1581,52 +1585,18 @@ class MatrioController:
         if not self.writer:
             raise ConnectionError("Not connected to device")
         
-        # Send the first command (0x0a) to trigger the protocol sequence that returns ALLNAMES
-        response = await self._send_protocol_command(0x0a)
-        if not response:
-            raise RuntimeError("Device did not respond to ALLNAMES command")
+        response = await self._get_allnames_frame()
         
         # Parse the ALLNAMES response to extract device info
         try:
-            # The ALLNAMES packet structure from packet capture:
-            # Header: 18961820a3000000823400000000000000000000
-            # Payload: 4d43552b5041532b82150b4441582038385f363136450b4c6976696e6720526f6f6d0e4d617374657220426564726f6f6d0d4465636b2055707374616972730f4465636b20446f776e7374616972730a446f776e737461697273065a4f4e453636055a4f4e4537055a4f4e45380254560c476f6f676c65204d7573696306496e7075743306496e7075743406496e7075743507496e707574363606496e70757437cc26
-            
-            # Skip the protocol header and get to the actual data
-            # The payload starts after the protocol header (20 bytes)
-            payload_start = 20
-            if len(response) < payload_start:
-                raise RuntimeError("Response too short to contain ALLNAMES data")
-            
-            # Extract the payload (skip protocol header)
-            payload = response[payload_start:]
-            
-            # The payload structure:
-            # MCU+PAS+ (8 bytes) + 8215 (2 bytes) + length (1 byte) + device_name + zone_names + input_names
-            
-            # Skip MCU+PAS+ and command (10 bytes)
-            data_start = 10
-            if len(payload) < data_start:
-                raise RuntimeError("Payload too short")
-            
-            data = payload[data_start:]
-            
-            # Parse the device name (first length-prefixed string)
-            if len(data) < 1:
-                raise RuntimeError("No device name length found")
-            
-            device_name_len = data[0]
-            if len(data) < 1 + device_name_len:
-                raise RuntimeError("Device name extends beyond data")
-            
-            device_name = data[1:1 + device_name_len].decode('ascii', errors='ignore')
+            device_name, _, _ = self._split_allnames(response)
             
             # The ALLNAMES packet only contains the device name and zone/input names
             # It does not contain MAC address, firmware, or hardware information
             # These would need to be obtained from other protocol commands or device queries
             
             return {
-                "device_name": device_name,
+                "device_name": device_name.decode('ascii', errors='ignore'),
                 "mac_address": None,  # Not available in ALLNAMES packet
                 "firmware": None,     # Not available in ALLNAMES packet  
                 "hardware": None      # Not available in ALLNAMES packet
@@ -1635,112 +1605,42 @@ class MatrioController:
         except Exception as e:
             raise RuntimeError(f"Failed to parse device info from response: {e}")
     
-    async def query_all_names(self) -> Dict[str, str]:
+    async def query_all_names(self, decode: bool = True) -> Dict[str, str | bytes]:
         """
         Query all zone and input names from the device
         Based on the logs, the device sends ALLNAMES packets with zone and input names
+        
+        Args:
+            decode: True to return names as str, False to return the raw ASCII bytes
+                    (for callers that only compare or hash names)
         """
         if not self.writer:
             raise ConnectionError("Not connected to device")
         
-        # Send the first command (0x0a) to trigger the protocol sequence that returns ALLNAMES
-        response = await self._send_protocol_command(0x0a)
-        if not response:
-            raise RuntimeError("Device did not respond to ALLNAMES command")
+        response = await self._get_allnames_frame()
         
-        # Parse the ALLNAMES response to extract zone and input names
+        return self._names_from_allnames(response, decode)
+    
+    def _names_from_allnames(self, response: bytes, decode: bool = True) -> Dict[str, str | bytes]:
+        """Build the zone_N/input_N name dictionary from an ALLNAMES frame, see query_all_names"""
         try:
-            # The ALLNAMES packet structure from packet capture:
-            # Header: 18961820a3000000823400000000000000000000
-            # Payload: 4d43552b5041532b82150b4441582038385f363136450b4c6976696e6720526f6f6d0e4d617374657220426564726f6f6d0d4465636b2055707374616972730f4465636b20446f776e7374616972730a446f776e737461697273065a4f4e453636055a4f4e4537055a4f4e45380254560c476f6f676c65204d7573696306496e7075743306496e7075743406496e7075743507496e707574363606496e70757437cc26
-            
-            # Skip the protocol header and get to the actual data
-            # The payload starts after the protocol header (20 bytes)
-            payload_start = 20
-            if len(response) < payload_start:
-                raise RuntimeError("Response too short to contain ALLNAMES data")
-            
-            # Extract the payload (skip protocol header)
-            payload = response[payload_start:]
-            
-            # The payload structure:
-            # MCU+PAS+ (8 bytes) + 8215 (2 bytes) + length (1 byte) + device_name + zone_names + input_names
-            
-            # Skip MCU+PAS+ and command (10 bytes)
-            data_start = 10
-            if len(payload) < data_start:
-                raise RuntimeError("Payload too short")
-            
-            data = payload[data_start:]
-            
-            # Parse length-prefixed strings
+            # Device name is not returned here
+            _, zone_names, input_names = self._split_allnames(response)
             names = {}
-            pos = 0
-            
-            # First string is device name (length 0x0b = 11 bytes)
-            if pos + 1 > len(data):
-                raise RuntimeError("No device name length found")
-            
-            device_name_len = data[pos]
-            pos += 1
-            
-            if pos + device_name_len > len(data):
-                raise RuntimeError("Device name extends beyond data")
-            
-            device_name = data[pos:pos + device_name_len].decode('ascii', errors='ignore')
-            pos += device_name_len
-            
-            # Parse zone names (8 zones)
-            zone_names = []
-            for zone_id in range(8):
-                if pos >= len(data):
-                    break
-                
-                name_len = data[pos]
-                pos += 1
-                
-                if pos + name_len > len(data):
-                    break
-                
-                zone_name = data[pos:pos + name_len].decode('ascii', errors='ignore')
-                zone_names.append(zone_name)
-                pos += name_len
-            
-            # Parse input names (8 inputs)
-            input_names = []
-            for input_id in range(8):
-                if pos >= len(data):
-                    # If we've reached the end of data, Input 8 is typically "Wi-Fi"
-                    if input_id == 7:  # Input 8 (index 7)
-                        input_names.append("Wi-Fi")
-                    break
-                
-                name_len = data[pos]
-                pos += 1
-                
-                if pos + name_len > len(data):
-                    # If we can't read the full name, Input 8 is typically "Wi-Fi"
-                    if input_id == 7:  # Input 8 (index 7)
-                        input_names.append("Wi-Fi")
-                    break
-                
-                input_name = data[pos:pos + name_len].decode('ascii', errors='ignore')
-                input_names.append(input_name)
-                pos += name_len
             
             # Ensure we have exactly 8 input names (pad with "Wi-Fi" for Input 8 if missing)
             while len(input_names) < 8:
                 if len(input_names) == 7:  # Input 8 (index 7)
-                    input_names.append("Wi-Fi")
+                    input_names.append(b"Wi-Fi")
                 else:
-                    input_names.append(f"Input{len(input_names) + 1}")
+                    input_names.append(b"Input%d" % (len(input_names) + 1))
             
             # Build the names dictionary
             for i, zone_name in enumerate(zone_names):
-                names[f"zone_{i}"] = zone_name
+                names[f"zone_{i}"] = zone_name.decode('ascii', errors='ignore') if decode else zone_name
             
             for i, input_name in enumerate(input_names):
-                names[f"input_{i+1}"] = input_name
+                names[f"input_{i+1}"] = input_name.decode('ascii', errors='ignore') if decode else input_name
             
             return names
             
@@ -1762,11 +1662,7 @@ class MatrioController:
             bool: True if command sent successfully
         """
         if not self.writer:
-            print("Not connected to device")
-            return False
-        
-        if zone_id < 1 or zone_id > 8:
-            print(f"Invalid zone ID: {zone_id}. Must be 1-8")
+            _LOGGER.debug("Not connected to device")
             return False
         
         # Map control types to command codes
@@ -1777,7 +1673,7 @@ class MatrioController:
         }
         
         if control_type not in command_codes:
-            print(f"Invalid control type: {control_type}. Must be 'balance', 'bass', or 'treble'")
+            _LOGGER.debug("Invalid control type: %s. Must be 'balance', 'bass', or 'treble'", control_type)
             return False
         
         command_code = command_codes[control_type]
@@ -1787,85 +1683,46 @@ class MatrioController:
             # Balance: -100 to +100 -> 0x01 to 0x3d (1 to 61)
             # Based on MatrioLog13.txt: 0x01=min left, 0x1f=middle, 0x3d=max right
             if value < -100 or value > 100:
-                print(f"Invalid balance value: {value}. Must be -100 to +100")
+                _LOGGER.debug("Invalid balance value: %s. Must be -100 to +100", value)
                 return False
             
-            # Use exact values from logs
-            if value == -100:
-                hex_value = 0x01  # Maximum left
-            elif value == 0:
-                hex_value = 0x1f  # Center (from logs)
-            elif value == 100:
-                hex_value = 0x3d  # Maximum right
-            else:
-                # Linear interpolation between known points
-                if value < 0:
-                    # Map -100 to 0 onto 0x01 to 0x1f
-                    hex_value = 0x01 + int((value + 100) / 100.0 * (0x1f - 0x01))
-                else:
-                    # Map 0 to 100 onto 0x1f to 0x3d
-                    hex_value = 0x1f + int(value / 100.0 * (0x3d - 0x1f))
-            hex_value = max(0x01, min(0x3d, hex_value))
+            hex_value = _BALANCE_CODES[value + 100]
             
         else:  # bass or treble
             # Bass/Treble: -12 to +12 -> 0x01 to 0x19 (1 to 25)
             # Based on actual UI mapping: 0x01=-12, 0x0d=0, 0x19=+12
             if value < -12 or value > 12:
-                print(f"Invalid {control_type} value: {value}. Must be -12 to +12")
+                _LOGGER.debug("Invalid %s value: %s. Must be -12 to +12", control_type, value)
                 return False
             
-            # Use the correct UI to hex conversion (limited range)
-            hex_value = self._ui_value_to_hex_limited(value)
+            # Range is validated above, so value + 13 is always 0x01 to 0x19
+            hex_value = value + 13
         
-        # Create zone pattern (zone selection)
-        zone_pattern = [0x02] * 8  # All zones unselected by default
-        zone_pattern[zone_id - 1] = 0x01  # Select the target zone
-        
-        # Create packet using exact format from working balance commands
-        packet_hex = f"1896182016000000e304000000000000000000004d43552b5041532b82{command_code:02x}{hex_value:02x}{''.join(f'{b:02x}' for b in zone_pattern)}ffcc26"
-        packet = bytes.fromhex(packet_hex)
+        # Create packet using exact format from working balance commands, the zone
+        # pattern has the target zone selected and all others unselected
+        packet = b"".join((
+            _AUDIO_HEADER, bytes((0x82, command_code, hex_value)), _ZONE8[zone_id - 1], _PKT_TRAILER
+        ))
         
         try:
-            self.writer.write(packet)
-            await self.writer.drain()
-            
-            # Wait for response like other working commands
-            response = await asyncio.wait_for(self.reader.read(1024), timeout=2.0)
+            response = await self._exchange(packet)
             
             if len(response) > 0:
-                print(f"Sent {control_type} command for zone {zone_id}: value={value} (0x{hex_value:02x}) - Response: {response.hex()[:20]}...")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Sent %s command for zone %s: value=%s (0x%02x) - Response: %s...",
+                        control_type, zone_id, value, hex_value, response[:10].hex()
+                    )
                 return True
             else:
-                print(f"{control_type} command for zone {zone_id} failed - no response")
+                _LOGGER.debug("%s command for zone %s failed - no response", control_type, zone_id)
                 return False
                 
         except Exception as e:
-            print(f"Failed to send {control_type} command: {e}")
+            _LOGGER.warning("Failed to send %s command: %s", control_type, e)
             return False
 
 
-    def _ui_value_to_hex_limited(self, ui_value: int) -> int:
-        """
-        Convert UI value (-12 to +12) to hex value for bass/treble controls (limited range)
-        
-        Args:
-            ui_value: UI value from -12 to +12
-            
-        Returns:
-            int: Hex value (0x01 to 0x19)
-        """
-        # Clamp value to valid range
-        ui_value = max(-12, min(12, ui_value))
-        
-        # Simple linear conversion: -12 to +12 maps to 0x01 to 0x19
-        # Range is 25 values: -12, -11, ..., 0, ..., +11, +12
-        # Hex range is 25 values: 0x01, 0x02, ..., 0x19
-        # Formula: hex = (ui_value + 12) + 1 = ui_value + 13
-        hex_value = ui_value + 13
-        
-        # Ensure it's within bounds (should always be 0x01 to 0x19)
-        return max(0x01, min(0x19, hex_value))
-    
     async def set_balance(self, zone_id: int, balance: int) -> bool:
         """
         Set balance for individual zone
@@ -1877,6 +1734,8 @@ class MatrioController:
         Returns:
             bool: True if command sent successfully
         """
+        if zone_id not in _VALID_IDS:
+            raise ValueError(f"Invalid zone ID: {zone_id}. Must be 1-8")
         return await self._send_audio_control_command(zone_id, 'balance', balance)
     
     async def set_bass(self, zone_id: int, bass: int) -> bool:
@@ -1890,6 +1749,8 @@ class MatrioController:
         Returns:
             bool: True if command sent successfully
         """
+        if zone_id not in _VALID_IDS:
+            raise ValueError(f"Invalid zone ID: {zone_id}. Must be 1-8")
         return await self._send_audio_control_command(zone_id, 'bass', bass)
     
     async def set_treble(self, zone_id: int, treble: int) -> bool:
@@ -1903,15 +1764,34 @@ class MatrioController:
         Returns:
             bool: True if command sent successfully
         """
+        if zone_id not in _VALID_IDS:
+            raise ValueError(f"Invalid zone ID: {zone_id}. Must be 1-8")
         return await self._send_audio_control_command(zone_id, 'treble', treble)
     
     async def trigger_hng_sync(self) -> Dict[str, Any] | None:
         """
         Trigger HNG sync packet and decode all zone states
         
+        Callers that arrive while a sync is already running await that sync
+        instead of starting another round trip.
+        
         Returns:
             Dict containing decoded zone states or None if failed
         """
+        task = self._hng_inflight
+        if task is None:
+            task = self._hng_inflight = asyncio.create_task(self._run_hng_sync())
+            task.add_done_callback(self._clear_hng_inflight)
+        # Shield so one cancelled caller doesn't cancel the sync for the others
+        return await asyncio.shield(task)
+    
+    def _clear_hng_inflight(self, task: asyncio.Task) -> None:
+        """Forget a finished HNG sync so the next caller starts a fresh one"""
+        if self._hng_inflight is task:
+            self._hng_inflight = None
+    
+    async def _run_hng_sync(self) -> Dict[str, Any] | None:
+        """Send the HNG sync request and decode the response, see trigger_hng_sync"""
         if not self.writer:
             _LOGGER.error("Not connected to device")
             return None
@@ -1919,47 +1799,27 @@ class MatrioController:
         try:
             _LOGGER.debug("Triggering HNG sync...")
             
-            # Use the existing protocol command that we know works
-            init_packet = bytes.fromhex("189618200f0000005706000000000000000000004d43552b5041532b820affffff8926")
-            self.writer.write(init_packet)
-            await self.writer.drain()
-            
-            # Wait for HNG_SYNC_COMMAND response
-            sync_response = await asyncio.wait_for(self.reader.read(1024), timeout=5.0)
-            if len(sync_response) == 0:
-                _LOGGER.debug("No sync response received")
-                return None
-            
-            _LOGGER.debug("Received sync response: %d bytes", len(sync_response))
-            
-            # Wait for ALLNAMES response
-            allnames_response = await asyncio.wait_for(self.reader.read(1024), timeout=5.0)
-            if len(allnames_response) == 0:
-                _LOGGER.debug("No ALLNAMES response received")
-                return None
-            
-            _LOGGER.debug("Received ALLNAMES response: %d bytes", len(allnames_response))
+            # Use the existing protocol command that we know works, reading the
+            # HNG_SYNC_COMMAND response through to the ALLNAMES (0x15) frame
+            frames = await self._exchange_until(_INIT_PACKET, 0x15)
+            _LOGGER.debug("Received %d response frames", len(frames))
+            self._names_cache = (time.monotonic(), frames[-1])
             
             # Look for HNG sync packet in the responses
-            combined_data = sync_response + allnames_response
+            combined_data = b"".join(frames)
             _LOGGER.debug("Combined data: %d bytes", len(combined_data))
             
-            # Check if this is a concatenated packet (multiple HNG sync packets)
-            if len(combined_data) > 100:  # Likely concatenated packets
-                _LOGGER.debug("Detected concatenated packets, extracting HNG sync...")
-                hng_hex = self._extract_hng_sync_packet(combined_data)
-                if not hng_hex:
-                    _LOGGER.warning("Could not extract HNG sync packet from concatenated data")
-                    return None
-            else:
-                hng_hex = combined_data.hex()
+            hng_packet = self._extract_hng_sync_packet(combined_data)
+            if not hng_packet:
+                _LOGGER.warning("Could not extract HNG sync packet from response data")
+                return None
             
             # Get input mappings from coordinator if available
             input_mappings = getattr(self, 'input_mappings', None)
             _LOGGER.debug("Using input mappings in trigger_hng_sync: %s", input_mappings)
             
             # Decode the packet
-            result = self.hng_decoder.decode_hng_sync_packet(hng_hex, input_mappings)
+            result = self.hng_decoder.decode_hng_sync_packet(hng_packet, input_mappings)
             
             _LOGGER.debug("HNG sync decoded: %s packet with %d zones", 
                          result['packet_type'], len(result['zones']))
@@ -1970,7 +1830,7 @@ class MatrioController:
             _LOGGER.error("HNG sync failed: %s", e)
             return None
     
-    def _extract_hng_sync_packet(self, data: bytes) -> str | None:
+    def _extract_hng_sync_packet(self, data: bytes) -> bytes | None:
         """
         Extract HNG sync packet from concatenated packet data
         
@@ -1978,34 +1838,31 @@ class MatrioController:
             data: Raw packet data that may contain multiple packets
             
         Returns:
-            Hex string of the HNG sync packet or None if not found
+            Raw bytes of the HNG sync packet or None if not found
         """
         try:
-            # Look for HNG sync packet signature (820c)
-            hng_signature = b'\x82\x0c'
-            
-            # Find the first occurrence of HNG sync signature
-            hng_pos = data.find(hng_signature)
+            # Look for the HNG sync payload (MCU+PAS+ 820c)
+            hng_pos = data.find(_HNG_SIGNATURE)
             if hng_pos == -1:
                 _LOGGER.warning("HNG sync signature not found in packet data")
                 return None
             
-            # Extract the HNG sync packet - try both 68-byte and 96-byte sizes
-            hng_start = hng_pos
+            # Extract the HNG sync packet from the 820c - try both 68-byte and 96-byte sizes
+            hng_start = hng_pos + len(_MCU_PAS)
             
             # Try 96-byte packet first (more common in newer devices)
             hng_end_96 = hng_start + 96
             if hng_end_96 <= len(data):
                 hng_packet = data[hng_start:hng_end_96]
                 _LOGGER.debug("Extracted 96-byte HNG sync packet: %d bytes", len(hng_packet))
-                return hng_packet.hex()
+                return hng_packet
             
             # Fall back to 68-byte packet
             hng_end_68 = hng_start + 68
             if hng_end_68 <= len(data):
                 hng_packet = data[hng_start:hng_end_68]
                 _LOGGER.debug("Extracted 68-byte HNG sync packet: %d bytes", len(hng_packet))
-                return hng_packet.hex()
+                return hng_packet
             
             _LOGGER.warning("HNG sync packet extends beyond received data")
             return None
@@ -2036,7 +1893,7 @@ class MatrioController:
             return hng_result['zones']
         return {}
     
-    def get_zone_state(self, zone_id: int, input_mappings: Dict[int, str]) -> Dict[str, Any] | None:
+    async def get_zone_state(self, zone_id: int, input_mappings: Dict[int, str]) -> Dict[str, Any] | None:
         """
         Get current state of a specific zone using HNG sync
         
@@ -2047,7 +1904,7 @@ class MatrioController:
         Returns:
             Dict containing zone state or None if failed
         """
-        zone_states = self.get_zone_states(input_mappings)
+        zone_states = await self.get_zone_states(input_mappings)
         if zone_states and zone_id in zone_states:
             return zone_states[zone_id]
         return None
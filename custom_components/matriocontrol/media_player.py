@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -13,7 +12,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, INPUTS, ZONES, VOLUME_MAX
+from .const import DOMAIN, VOLUME_MAX, ZONES
 from .coordinator import MatrioControlDataUpdateCoordinator
 from .entity import MatrioControlEntity
 
@@ -28,17 +27,22 @@ async def async_setup_entry(
     """Set up the media player platform."""
     coordinator: MatrioControlDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = []
     # Create entities for all 8 zones - names will be updated from coordinator data
-    for zone_id in range(1, 9):
-        entities.append(MatrioControlMediaPlayer(coordinator, zone_id))
-    
-    async_add_entities(entities)
+    async_add_entities([MatrioControlMediaPlayer(coordinator, zone_id) for zone_id in range(1, 9)])
 
 
 class MatrioControlMediaPlayer(MatrioControlEntity, MediaPlayerEntity):
     """Representation of a Matrio zone as a media player."""
 
+    _attr_supported_features = (
+        MediaPlayerEntityFeature.VOLUME_SET
+        | MediaPlayerEntityFeature.VOLUME_MUTE
+        | MediaPlayerEntityFeature.VOLUME_STEP
+        | MediaPlayerEntityFeature.TURN_ON
+        | MediaPlayerEntityFeature.TURN_OFF
+        | MediaPlayerEntityFeature.SELECT_SOURCE
+    )
+
     def __init__(
         self, 
         coordinator: MatrioControlDataUpdateCoordinator, 
@@ -47,101 +51,32 @@ class MatrioControlMediaPlayer(MatrioControlEntity, MediaPlayerEntity):
         """Initialize the media player."""
         super().__init__(coordinator, zone_id)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_zone_{zone_id}"
-        self._attr_supported_features = (
-            MediaPlayerEntityFeature.VOLUME_SET
-            | MediaPlayerEntityFeature.VOLUME_MUTE
-            | MediaPlayerEntityFeature.VOLUME_STEP
-            | MediaPlayerEntityFeature.TURN_ON
-            | MediaPlayerEntityFeature.TURN_OFF
-            | MediaPlayerEntityFeature.SELECT_SOURCE
-        )
+        self._update_attrs()
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        zones = self.coordinator.data.get("zones", {})
-        zone_key = f"zone_{self.zone_id}"
-        zone_name = zones.get(zone_key, f"Zone {self.zone_id}")
-        _LOGGER.debug("Media player Zone %d name: %s (zones data: %s)", self.zone_id, zone_name, zones)
-        return zone_name
-
-    @property
-    def state(self) -> MediaPlayerState:
-        """Return the state of the device."""
-        if not self.coordinator.data.get("connected", False):
-            return MediaPlayerState.OFF
-        
+    def _update_attrs(self) -> bool:
+        """Set the zone name, source list and state from coordinator data."""
+        data = self.coordinator.data
         # Get zone state from HNG sync data
-        zone_states = self.coordinator.data.get("zone_states", {})
-        zone_state = zone_states.get(self.zone_id)
+        zone_state = data.get("zone_states", {}).get(self.zone_id) or {}
         
-        if zone_state and zone_state.get("power") == "ON":
-            return MediaPlayerState.ON
-        elif zone_state and zone_state.get("power") == "OFF":
-            return MediaPlayerState.OFF
+        # Disconnected or an explicit OFF is off, anything else falls back to ON
+        if not data.get("connected", False) or zone_state.get("power") == "OFF":
+            state = MediaPlayerState.OFF
         else:
-            # Fallback to connected state if no zone state available
-            return MediaPlayerState.ON if self.coordinator.data.get("connected", False) else MediaPlayerState.OFF
-
-    @property
-    def source_list(self) -> list[str]:
-        """Return the list of available input sources."""
-        # Use input_mappings if available, otherwise fall back to inputs
-        input_mappings = self.coordinator.data.get("input_mappings", {})
-        if input_mappings:
-            return list(input_mappings.values())
-        
-        inputs = self.coordinator.data.get("inputs", INPUTS)
-        return list(inputs.values())
-
-    @property
-    def source(self) -> str | None:
-        """Return the current input source."""
-        # Get zone state from HNG sync data
-        zone_states = self.coordinator.data.get("zone_states", {})
-        zone_state = zone_states.get(self.zone_id)
-        
-        _LOGGER.debug("Zone %d source check - zone_states: %s, zone_state: %s", 
-                     self.zone_id, zone_states, zone_state)
-        
-        if zone_state and "input" in zone_state:
-            _LOGGER.debug("Zone %d returning input: %s", self.zone_id, zone_state["input"])
-            return zone_state["input"]
-        
-        _LOGGER.debug("Zone %d returning None for source", self.zone_id)
-        return None
-
-    @property
-    def volume_level(self) -> float | None:
-        """Volume level of the media player (0..1)."""
-        # Get zone state from HNG sync data
-        zone_states = self.coordinator.data.get("zone_states", {})
-        zone_state = zone_states.get(self.zone_id)
-        
-        _LOGGER.debug("Zone %d volume check - zone_states: %s, zone_state: %s", 
-                     self.zone_id, zone_states, zone_state)
-        
-        if zone_state and "volume" in zone_state:
-            # Convert from 0..38 range to 0..1 range
-            volume = zone_state["volume"]
-            volume_level = volume / VOLUME_MAX if VOLUME_MAX > 0 else 0.0
-            _LOGGER.debug("Zone %d returning volume: %s -> %s", self.zone_id, volume, volume_level)
-            return volume_level
-        
-        _LOGGER.debug("Zone %d returning None for volume", self.zone_id)
-        return None
-
-    @property
-    def is_volume_muted(self) -> bool | None:
-        """Boolean if volume is currently muted."""
-        # Get zone state from HNG sync data
-        zone_states = self.coordinator.data.get("zone_states", {})
-        zone_state = zone_states.get(self.zone_id)
+            state = MediaPlayerState.ON
         
-        if zone_state and "mute" in zone_state:
-            return zone_state["mute"] == "MUTED"
+        # Convert volume from 0..38 range to 0..1 range, VOLUME_MAX is a non-zero constant
+        volume = zone_state.get("volume")
         
-        return False
+        return self._set_attrs(
+            name=data.get("zones", {}).get(f"zone_{self.zone_id}", ZONES[self.zone_id]),
+            # One input name list per coordinator update, shared by all zones
+            source_list=data.get("input_options", []),
+            state=state,
+            source=zone_state.get("input"),
+            volume_level=volume / VOLUME_MAX if volume is not None else None,
+            is_volume_muted=zone_state.get("mute") == "MUTED",
+        )
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
@@ -169,33 +104,12 @@ class MatrioControlMediaPlayer(MatrioControlEntity, MediaPlayerEntity):
         """Select input source."""
         _LOGGER.debug("async_select_source called: zone_id=%s, source='%s'", self.zone_id, source)
         
-        # Find input ID by name using input_mappings if available
-        input_mappings = self.coordinator.data.get("input_mappings", {})
-        _LOGGER.debug("input_mappings: %s", input_mappings)
-        
-        if input_mappings:
-            # Use input_mappings (device names)
-            input_id = None
-            for iid, name in input_mappings.items():
-                if name == source:
-                    input_id = iid
-                    break
-            _LOGGER.debug("Found input_id %s using input_mappings", input_id)
-        else:
-            # Fall back to inputs
-            inputs = self.coordinator.data.get("inputs", INPUTS)
-            _LOGGER.debug("Using fallback inputs: %s", inputs)
-            input_id = None
-            for iid, name in inputs.items():
-                if name == source:
-                    input_id = iid
-                    break
-            _LOGGER.debug("Found input_id %s using fallback inputs", input_id)
+        # Find input ID by name, the coordinator keeps a name -> ID index of the current inputs
+        input_id = self.coordinator.data.get("input_name_to_id", {}).get(source)
+        _LOGGER.debug("Found input_id %s for source '%s'", input_id, source)
         
         if input_id:
-            _LOGGER.debug("Calling controller.set_input(%s, %s)", self.zone_id, input_id)
             await self.coordinator.controller.set_input(self.zone_id, input_id)
             # State will be updated via broadcast callback
-            _LOGGER.debug("async_select_source completed for zone %s", self.zone_id)
         else:
             _LOGGER.debug("No input_id found for source '%s'", source)
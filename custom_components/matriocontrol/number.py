@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
 
@@ -16,6 +16,15 @@ from .entity import MatrioControlEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+SET_VALUE_COOLDOWN = 0.2  # Seconds - a burst of slider changes is sent to the device as its last value
+
+# Number kind -> (name suffix, min, max, controller setter), the kind is also the zone_states key
+_NUMBER_KINDS = {
+    "bass": ("Bass", BASS_TREBLE_MIN, BASS_TREBLE_MAX, "set_bass"),
+    "treble": ("Treble", BASS_TREBLE_MIN, BASS_TREBLE_MAX, "set_treble"),
+    "balance": ("Balance", BALANCE_MIN, BALANCE_MAX, "set_balance"),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,155 +34,90 @@ async def async_setup_entry(
     """Set up the number platform."""
     coordinator: MatrioControlDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = []
     # Create entities for all 8 zones - names will be updated from coordinator data
-    for zone_id in range(1, 9):
-        entities.extend([
-            MatrioControlBassNumber(coordinator, zone_id),
-            MatrioControlTrebleNumber(coordinator, zone_id),
-            MatrioControlBalanceNumber(coordinator, zone_id),
-        ])
-    
-    async_add_entities(entities)
-
+    async_add_entities([
+        MatrioControlNumber(coordinator, zone_id, kind)
+        for zone_id in range(1, 9)
+        for kind in _NUMBER_KINDS
+    ])
 
-class MatrioControlBassNumber(MatrioControlEntity, NumberEntity):
-    """Representation of a Matrio zone bass control."""
-
-    def __init__(
-        self, 
-        coordinator: MatrioControlDataUpdateCoordinator, 
-        zone_id: int
-    ) -> None:
-        """Initialize the bass number."""
-        super().__init__(coordinator, zone_id)
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_zone_{zone_id}_bass"
-        self._attr_native_min_value = BASS_TREBLE_MIN
-        self._attr_native_max_value = BASS_TREBLE_MAX
-        self._attr_native_step = 1
-        self._attr_mode = NumberMode.SLIDER
-        self._attr_entity_category = EntityCategory.CONFIG
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        zones = self.coordinator.data.get("zones", {})
-        zone_key = f"zone_{self.zone_id}"
-        zone_name = zones.get(zone_key, f"Zone {self.zone_id}")
-        return f"{zone_name} Bass"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        # Get zone state from HNG sync data
-        zone_states = self.coordinator.data.get("zone_states", {})
-        zone_state = zone_states.get(self.zone_id)
-        
-        if zone_state and "bass" in zone_state:
-            return float(zone_state["bass"])
-        
-        return 0.0
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the value."""
-        await self.coordinator.controller.set_bass(self.zone_id, int(value))
-        # State will be updated via broadcast callback
 
+class MatrioControlNumber(MatrioControlEntity, NumberEntity):
+    """Representation of a Matrio zone bass, treble or balance control."""
 
-class MatrioControlTrebleNumber(MatrioControlEntity, NumberEntity):
-    """Representation of a Matrio zone treble control."""
+    _attr_native_step = 1
+    _attr_mode = NumberMode.SLIDER
+    _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(
         self, 
         coordinator: MatrioControlDataUpdateCoordinator, 
-        zone_id: int
+        zone_id: int,
+        kind: str
     ) -> None:
-        """Initialize the treble number."""
+        """Initialize the number."""
         super().__init__(coordinator, zone_id)
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_zone_{zone_id}_treble"
-        self._attr_native_min_value = BASS_TREBLE_MIN
-        self._attr_native_max_value = BASS_TREBLE_MAX
-        self._attr_native_step = 1
-        self._attr_mode = NumberMode.SLIDER
-        self._attr_entity_category = EntityCategory.CONFIG
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        zones = self.coordinator.data.get("zones", {})
-        zone_key = f"zone_{self.zone_id}"
-        zone_name = zones.get(zone_key, f"Zone {self.zone_id}")
-        return f"{zone_name} Treble"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        # Get zone state from HNG sync data
-        zone_states = self.coordinator.data.get("zone_states", {})
-        zone_state = zone_states.get(self.zone_id)
+        self._kind = kind
+        self._label, self._attr_native_min_value, self._attr_native_max_value, self._setter = _NUMBER_KINDS[kind]
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_zone_{zone_id}_{kind}"
+        self._pending_value: int | None = None
+        self._set_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=SET_VALUE_COOLDOWN,
+            immediate=False,
+            function=self._async_send_pending_value,
+        )
+        self._update_attrs()
+
+    def _update_attrs(self) -> bool:
+        """Set the number's name and value from coordinator data."""
+        data = self.coordinator.data
+        zone_name = data.get("zones", {}).get(f"zone_{self.zone_id}", ZONES[self.zone_id])
         
-        if zone_state and "treble" in zone_state:
-            return float(zone_state["treble"])
-        
-        return 0.0
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the value."""
-        await self.coordinator.controller.set_treble(self.zone_id, int(value))
-        # State will be updated via broadcast callback
-
-
-class MatrioControlBalanceNumber(MatrioControlEntity, NumberEntity):
-    """Representation of a Matrio zone balance control."""
-
-    def __init__(
-        self, 
-        coordinator: MatrioControlDataUpdateCoordinator, 
-        zone_id: int
-    ) -> None:
-        """Initialize the balance number."""
-        super().__init__(coordinator, zone_id)
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_zone_{zone_id}_balance"
-        self._attr_native_min_value = BALANCE_MIN
-        self._attr_native_max_value = BALANCE_MAX
-        self._attr_native_step = 1
-        self._attr_mode = NumberMode.SLIDER
-        self._attr_entity_category = EntityCategory.CONFIG
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        zones = self.coordinator.data.get("zones", {})
-        zone_key = f"zone_{self.zone_id}"
-        zone_name = zones.get(zone_key, f"Zone {self.zone_id}")
-        return f"{zone_name} Balance"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
         # Get zone state from HNG sync data
-        zone_states = self.coordinator.data.get("zone_states", {})
-        zone_state = zone_states.get(self.zone_id)
-        
-        if zone_state and "balance" in zone_state:
-            # Convert balance string to numeric value
-            balance_str = zone_state["balance"]
-            if balance_str == "MAX Right":
-                return 100.0
-            elif balance_str == "MAX Left":
-                return -100.0
-            elif balance_str == "Default" or balance_str == "Center":
-                return 0.0
-            else:
-                # Try to parse as numeric value
-                try:
-                    return float(balance_str)
-                except (ValueError, TypeError):
-                    return 0.0
+        zone_state = data.get("zone_states", {}).get(self.zone_id)
+        if not zone_state or self._kind not in zone_state:
+            value = 0.0
+        elif self._kind == "balance":
+            # Converted from the balance label once per update by the coordinator
+            value = zone_state["balance_value"]
+        else:
+            value = float(zone_state[self._kind])
         
-        return 0.0
+        return self._set_attrs(name=f"{zone_name} {self._label}", native_value=value)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
-        await self.coordinator.controller.set_balance(self.zone_id, int(value))
-        # State will be updated via broadcast callback
+        self._pending_value = int(value)
+        await self._set_debouncer.async_call()
+
+    async def _async_send_pending_value(self) -> None:
+        """Send the latest requested value to the device, re-reading the zone if it fails."""
+        if await self._async_write_pending_value():
+            # State will be updated via broadcast callback
+            return
+        # No broadcast follows a failed write, read the zone back and write the state
+        # even if it is unchanged so the slider snaps back to the device value
+        await self.coordinator.async_resync_zones()
+        self.async_write_ha_state()
+
+    async def _async_write_pending_value(self) -> bool:
+        """Write the latest requested value to the device, return False if the device did not take it."""
+        value, self._pending_value = self._pending_value, None
+        if value is None:
+            return True
+        try:
+            if await getattr(self.coordinator.controller, self._setter)(self.zone_id, value):
+                return True
+            _LOGGER.warning("Zone %s %s was not set to %s", self.zone_id, self._kind, value)
+        except Exception as e:
+            _LOGGER.warning("Failed to set zone %s %s to %s: %s", self.zone_id, self._kind, value, e)
+        return False
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Called when entity will be removed from Home Assistant."""
+        # Send a value still waiting out the cooldown instead of dropping it
+        self._set_debouncer.async_cancel()
+        await self._async_write_pending_value()
+        await super().async_will_remove_from_hass()
@@ -0,0 +1,58 @@
+"""Fixtures for the MatrioControl integration tests."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.matriocontrol.const import DOMAIN
+
+ZONE_STATE = {
+    "power": "ON",
+    "input": "TV",
+    "volume": 19,
+    "mute": "DEFAULT",
+    "balance": "Default",
+    "bass": 2,
+    "treble": -3,
+}
+
+
+class FakeController:
+    """Connected MatrioController stand-in holding fixed zone states"""
+
+    def __init__(self, ip, port=None):
+        self.connected = False
+        self.state_callback = None
+        self.zones = {zone_id: dict(ZONE_STATE, zone_id=zone_id) for zone_id in range(1, 9)}
+        self.zone_names = {1: "Living Room"}
+        self.get_zone_states = AsyncMock(side_effect=lambda inputs: self.zones)
+        self.set_bass = AsyncMock(return_value=True)
+        self.set_treble = AsyncMock(return_value=True)
+        self.set_balance = AsyncMock(return_value=True)
+
+    async def connect(self, state_callback=None):
+        self.state_callback = state_callback
+        self.connected = True
+        return True
+
+    async def disconnect(self):
+        self.connected = False
+
+    def get_available_inputs(self):
+        return {1: "TV", 2: "Google Music"}
+
+
+@pytest.fixture
+def entry(hass):
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "127.0.0.1", "port": 8899})
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def fake_controller(hass, enable_custom_integrations, entry):
+    """Set the integration up against a FakeController"""
+    with patch("custom_components.matriocontrol.coordinator.MatrioController", FakeController):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id].controller
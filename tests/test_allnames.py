@@ -0,0 +1,42 @@
+"""Tests for parsing the ALLNAMES (82 15) frame."""
+import pytest
+
+from custom_components.matriocontrol.matrio_controller import MatrioController
+
+from .test_framing import ALLNAMES, HNG
+
+
+@pytest.fixture
+def controller():
+    return MatrioController("127.0.0.1")
+
+
+def test_split_allnames(controller):
+    device_name, zone_names, input_names = controller._split_allnames(ALLNAMES)
+    assert device_name == b"DAX 88_616E"
+    assert zone_names[:3] == [b"Living Room", b"Master Bedroom", b"Deck Upstairs"]
+    assert len(zone_names) == 8
+    assert input_names == [
+        b"TV", b"Google Music", b"Input3", b"Input4", b"Input5", b"Input66", b"Input7",
+    ]
+
+
+def test_names_pad_missing_inputs(controller):
+    names = controller._names_from_allnames(ALLNAMES)
+    assert names["zone_0"] == "Living Room"
+    assert names["input_8"] == "Wi-Fi"
+    assert controller._names_from_allnames(ALLNAMES, decode=False)["input_2"] == b"Google Music"
+
+
+def test_truncated_frame_drops_partial_name(controller):
+    # Cut inside the last input name
+    _, zone_names, input_names = controller._split_allnames(ALLNAMES[:-5])
+    assert len(zone_names) == 8
+    assert input_names[-1] == b"Input66"
+
+
+def test_other_frames_are_rejected(controller):
+    with pytest.raises(RuntimeError, match="8215"):
+        controller._split_allnames(HNG)
+    with pytest.raises(RuntimeError, match="MCU"):
+        controller._split_allnames(ALLNAMES[:20] + b"x" * 40)
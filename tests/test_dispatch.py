@@ -0,0 +1,105 @@
+"""Tests for handing replies read by the reader loop to waiting exchanges."""
+import asyncio
+
+import pytest
+
+from custom_components.matriocontrol import matrio_controller
+from custom_components.matriocontrol.matrio_controller import BroadcastDecoder, MatrioController
+
+
+def _volume_packet(value: int) -> bytes:
+    """Zone 1 volume command, the device echoes it back as its reply"""
+    return bytes.fromhex(
+        "1896182016000000b604000000000000000000004d43552b5041532b8201%02x0102020202020202ffcc26" % value
+    )
+
+
+VOLUME_5 = _volume_packet(5)
+VOLUME_6 = _volume_packet(6)
+# Zone 1 mute echo, e.g. from another controller
+MUTE = bytes.fromhex(
+    "1896182016000000b104000000000000000000004d43552b5041532b820e020102020202020202ffcc26"
+)
+
+
+class FakeWriter:
+    """Device connection writer that records what is sent"""
+
+    def __init__(self):
+        self.sent = []
+
+    def write(self, data):
+        self.sent.append(bytes(data))
+
+    async def drain(self):
+        pass
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.setattr(matrio_controller, "_ACK_TIMEOUT", 0.2)
+    controller = MatrioController("127.0.0.1")
+    controller.reader = asyncio.StreamReader()
+    controller.writer = FakeWriter()
+    return controller
+
+
+@pytest.fixture
+async def dispatching(controller):
+    """Run the reader loop so it owns the connection"""
+    controller.connected = True
+    controller.broadcast_decoder = BroadcastDecoder(controller.inputs)
+    task = asyncio.create_task(controller._reader_loop())
+    while not controller._dispatching:
+        await asyncio.sleep(0)
+    yield controller
+    controller.connected = False
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_exchange_reads_until_matching_reply(controller):
+    controller.reader.feed_data(MUTE + VOLUME_5)
+    assert await controller._exchange(VOLUME_5) == VOLUME_5
+    assert controller.writer.sent == [VOLUME_5]
+
+
+async def test_dispatched_exchange_skips_other_frames(dispatching):
+    exchange = asyncio.create_task(dispatching._exchange(VOLUME_5))
+    await asyncio.sleep(0)
+    dispatching.reader.feed_data(MUTE)
+    await asyncio.sleep(0.01)
+    assert not exchange.done()
+    dispatching.reader.feed_data(VOLUME_5)
+    assert await exchange == VOLUME_5
+
+
+async def test_late_reply_is_not_taken_by_next_exchange(dispatching):
+    with pytest.raises(TimeoutError):
+        await dispatching._exchange(VOLUME_5)
+
+    exchange = asyncio.create_task(dispatching._exchange(VOLUME_6))
+    await asyncio.sleep(0)
+    # The timed-out exchange's echo arrives first
+    dispatching.reader.feed_data(VOLUME_5)
+    await asyncio.sleep(0.01)
+    assert not exchange.done()
+    dispatching.reader.feed_data(VOLUME_6)
+    assert await exchange == VOLUME_6
+    assert dispatching._late_replies == []
+
+
+async def test_frame_without_pending_exchange_is_ignored(dispatching):
+    dispatching.reader.feed_data(VOLUME_5)
+    await asyncio.sleep(0.01)
+    dispatching.reader.feed_data(VOLUME_6)
+    assert await dispatching._exchange(VOLUME_6) == VOLUME_6
+
+
+async def test_connection_loss_fails_pending_exchange(dispatching):
+    exchange = asyncio.create_task(dispatching._exchange(VOLUME_5))
+    await asyncio.sleep(0)
+    dispatching.reader.feed_eof()
+    with pytest.raises(ConnectionError):
+        await exchange
+    assert not dispatching.connected
@@ -0,0 +1,53 @@
+"""Tests for the entities' state from coordinator data."""
+from unittest.mock import patch
+
+from homeassistant.const import STATE_OFF, STATE_ON
+
+from custom_components.matriocontrol.const import DOMAIN
+from custom_components.matriocontrol.number import MatrioControlNumber
+
+
+async def test_states_from_zone_data(hass, fake_controller):
+    player = hass.states.get("media_player.living_room")
+    assert player.state == STATE_ON
+    assert player.attributes["source"] == "TV"
+    assert player.attributes["source_list"] == ["TV", "Google Music"]
+    assert player.attributes["volume_level"] == 0.5
+    assert player.attributes["is_volume_muted"] is False
+    assert hass.states.get("media_player.zone_2").state == STATE_ON
+    assert hass.states.get("number.living_room_bass").state == "2.0"
+    assert hass.states.get("number.living_room_treble").state == "-3.0"
+    assert hass.states.get("number.living_room_balance").state == "0.0"
+    assert hass.states.get("binary_sensor.device_status").state == STATE_ON
+
+
+async def test_broadcast_updates_entities(hass, fake_controller):
+    fake_controller.zones[1].update(volume=38, mute="MUTED", balance="MAX Left")
+    fake_controller.zones[2]["power"] = "OFF"
+    fake_controller.state_callback(fake_controller.zones)
+    await hass.async_block_till_done()
+
+    player = hass.states.get("media_player.living_room")
+    assert player.attributes["volume_level"] == 1.0
+    assert player.attributes["is_volume_muted"] is True
+    assert hass.states.get("media_player.zone_2").state == STATE_OFF
+    assert hass.states.get("number.living_room_balance").state == "-100.0"
+
+
+async def test_unchanged_update_skips_state_write(hass, entry, fake_controller):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    with patch.object(MatrioControlNumber, "async_write_ha_state") as write:
+        coordinator.async_update_listeners()
+        assert write.call_count == 0
+
+        fake_controller.zones[3]["bass"] = 5
+        coordinator._update_entities_from_zones(fake_controller.zones)
+        assert write.call_count == 1
+    assert hass.states.get("number.zone_3_bass").state == "2.0"
+
+
+async def test_disconnect_writes_unavailable(hass, entry, fake_controller):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    assert hass.states.get("number.living_room_bass").state == "unavailable"
@@ -0,0 +1,131 @@
+"""Tests for splitting the device stream into protocol frames."""
+import asyncio
+import random
+
+import pytest
+
+from custom_components.matriocontrol.matrio_controller import MatrioController, _PKT_MAGIC
+
+# Volume command echo (82 01), 22 bytes after the header
+ACK = bytes.fromhex(
+    "1896182016000000b604000000000000000000004d43552b5041532b"
+    "8201050102020202020202ffcc26"
+)
+# 0x0c sync frame as captured: declares 0x4c bytes after the header, carries 0x4b
+HNG_SHORT = bytes.fromhex(
+    "189618204c000000a908000000000000000000004d43552b5041532b"
+    "820c0108080808080808070f22171d0805050d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "1f1f1f1f1f1f1f1f02010201010101010101010102010101010140180c14ffffcc26"
+)
+# 0x0c sync frame carrying all 0x4c bytes it declares
+HNG = bytes.fromhex(
+    "189618204c0000009e08000000000000000000004d43552b5041532b"
+    "820c0104030208080804050a01271d0805050d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "1f3d1f1f1f1f1f1f02010201020101010101010101020101010240180c14ffffcc26"
+)
+ALLNAMES = bytes.fromhex(
+    "18961820a3000000823400000000000000000000"
+    "4d43552b5041532b82150b4441582038385f363136450b4c6976696e6720526f6f6d"
+    "0e4d617374657220426564726f6f6d0d4465636b2055707374616972730f4465636b"
+    "20446f776e7374616972730a446f776e737461697273065a4f4e453636055a4f4e45"
+    "37055a4f4e45380254560c476f6f676c65204d7573696306496e7075743306496e70"
+    "75743406496e7075743507496e707574363606496e70757437cc26"
+)
+
+STREAMS = {
+    "short_sync": [ACK, HNG_SHORT, ALLNAMES],
+    "full_sync": [ACK, HNG, ALLNAMES],
+}
+
+
+def _split(*chunks: bytes) -> tuple[list[bytes], bytes]:
+    """Feed chunks through _next_frame as reads would, return the frames and what is left"""
+    controller = MatrioController("127.0.0.1")
+    frames = []
+    for chunk in chunks:
+        controller._rx_buffer += chunk
+        while (frame := controller._next_frame()) is not None:
+            frames.append(frame)
+    return frames, bytes(controller._rx_buffer)
+
+
+def test_frame_lengths():
+    assert len(HNG_SHORT) == 95
+    assert len(HNG) == 96
+
+
+@pytest.mark.parametrize("name", STREAMS)
+def test_coalesced_frames(name):
+    frames = STREAMS[name]
+    assert _split(b"".join(frames)) == (frames, b"")
+
+
+@pytest.mark.parametrize("name", STREAMS)
+def test_every_split_position(name):
+    frames = STREAMS[name]
+    stream = b"".join(frames)
+    for pos in range(1, len(stream)):
+        assert _split(stream[:pos], stream[pos:]) == (frames, b""), pos
+
+
+@pytest.mark.parametrize("name", STREAMS)
+def test_byte_by_byte(name):
+    frames = STREAMS[name]
+    stream = b"".join(frames)
+    assert _split(*(stream[i:i + 1] for i in range(len(stream)))) == (frames, b"")
+
+
+@pytest.mark.parametrize("name", STREAMS)
+def test_random_splits(name):
+    frames = STREAMS[name]
+    stream = b"".join(frames)
+    rng = random.Random(0)
+    for _ in range(500):
+        cuts = sorted(rng.sample(range(1, len(stream)), rng.randint(1, 8)))
+        chunks = [stream[a:b] for a, b in zip([0, *cuts], [*cuts, len(stream)])]
+        assert _split(*chunks) == (frames, b""), cuts
+
+
+def test_full_sync_frame_is_not_cut_short():
+    # 95 bytes of a 96-byte sync frame are not a complete frame
+    assert _split(HNG[:95]) == ([], HNG[:95])
+    assert _split(HNG[:95], HNG[95:]) == ([HNG], b"")
+
+
+def test_incomplete_frame_waits():
+    assert _split(ALLNAMES[:-1]) == ([], ALLNAMES[:-1])
+    assert _split(_PKT_MAGIC[:3]) == ([], _PKT_MAGIC[:3])
+
+
+def test_unframed_data_resyncs_on_magic():
+    bare = bytes.fromhex("820e01")
+    # The magic of the next frame arrives split across reads
+    assert _split(bare + ALLNAMES[:2], ALLNAMES[2:]) == ([bare, ALLNAMES], b"")
+
+
+def test_oversized_length_resyncs_on_magic():
+    garbage = _PKT_MAGIC + b"\xff\xff\xff\x00" + b"x" * 20
+    assert _split(garbage + ACK) == ([garbage, ACK], b"")
+
+
+async def test_read_frame_across_reads():
+    controller = MatrioController("127.0.0.1")
+    controller.reader = asyncio.StreamReader()
+    stream = ACK + HNG_SHORT + ALLNAMES
+    controller.reader.feed_data(stream[:40])
+    controller.reader.feed_data(stream[40:130])
+    controller.reader.feed_data(stream[130:])
+    controller.reader.feed_eof()
+
+    assert [await controller._read_frame() for _ in range(3)] == [ACK, HNG_SHORT, ALLNAMES]
+    with pytest.raises(asyncio.IncompleteReadError):
+        await controller._read_frame()
+
+
+async def test_read_frame_returns_leftover_on_close():
+    controller = MatrioController("127.0.0.1")
+    controller.reader = asyncio.StreamReader()
+    controller.reader.feed_data(ALLNAMES[:30])
+    controller.reader.feed_eof()
+
+    assert await controller._read_frame() == ALLNAMES[:30]
@@ -0,0 +1,64 @@
+"""Tests for sending number values to the device."""
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from homeassistant.components.number import ATTR_VALUE, DOMAIN as NUMBER_DOMAIN, SERVICE_SET_VALUE
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.matriocontrol.number import MatrioControlNumber
+
+BASS = "number.living_room_bass"
+
+
+async def _set_value(hass, value, entity_id=BASS):
+    await hass.services.async_call(
+        NUMBER_DOMAIN, SERVICE_SET_VALUE, {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: value}, blocking=True
+    )
+
+
+async def _cooldown(hass):
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+
+async def test_burst_sends_last_value(hass, fake_controller):
+    for value in (3, 4, 5):
+        await _set_value(hass, value)
+    fake_controller.set_bass.assert_not_awaited()
+
+    await _cooldown(hass)
+    fake_controller.set_bass.assert_awaited_once_with(1, 5)
+    fake_controller.get_zone_states.assert_not_awaited()
+
+
+async def test_out_of_range_value_is_rejected(hass, fake_controller):
+    with pytest.raises(ValueError):
+        await _set_value(hass, 20)
+    await _cooldown(hass)
+    fake_controller.set_bass.assert_not_awaited()
+
+
+@pytest.mark.parametrize("result", [{"return_value": False}, {"side_effect": ConnectionError}])
+async def test_failed_write_resyncs_zone(hass, fake_controller, result):
+    fake_controller.set_bass.configure_mock(**result)
+    await _set_value(hass, 5)
+    with patch.object(MatrioControlNumber, "async_write_ha_state", autospec=True) as write:
+        await _cooldown(hass)
+
+    fake_controller.get_zone_states.assert_awaited_once()
+    # Written although unchanged, so the slider goes back to the device value
+    assert [call.args[0].entity_id for call in write.call_args_list] == [BASS]
+    assert hass.states.get(BASS).state == "2.0"
+
+
+async def test_pending_value_is_sent_on_unload(hass, entry, fake_controller):
+    await _set_value(hass, 5)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    fake_controller.set_bass.assert_awaited_once_with(1, 5)
+
+    await _cooldown(hass)
+    fake_controller.set_bass.assert_awaited_once()
@@ -0,0 +1,129 @@
+"""Tests for the HTTP requests sent to the UPnP port during initialization."""
+import asyncio
+
+import pytest
+
+from custom_components.matriocontrol import matrio_controller
+from custom_components.matriocontrol.matrio_controller import MatrioController
+
+OK = b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhello"
+OK_CLOSE = b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 0\r\n\r\n"
+OK_NO_LENGTH = b"HTTP/1.1 200 OK\r\nSID: uuid:1\r\n\r\n"
+REQUEST = "GET / HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Length: 0\r\n\r\n"
+
+
+class FakeUpnpPort:
+    """UPnP port stand-in answering each request with the next scripted reply
+
+    A reply is (bytes or None for no reply, whether to close the connection after it).
+    """
+
+    def __init__(self):
+        self.replies: list[tuple[bytes | None, bool]] = []
+        self.connections = 0
+        self.requests = 0
+        self._writers = []
+        self._server = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self._server.close()
+        for writer in self._writers:
+            writer.close()
+        await self._server.wait_closed()
+        await asyncio.sleep(0)
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.append(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":")[1])
+                await reader.readexactly(length)
+                self.requests += 1
+                reply, close = self.replies.pop(0) if self.replies else (OK, False)
+                if reply is not None:
+                    writer.write(reply)
+                    await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def upnp_port(socket_enabled, monkeypatch):
+    port = FakeUpnpPort()
+    monkeypatch.setattr(matrio_controller, "_UPNP_PORT", await port.start())
+    monkeypatch.setattr(matrio_controller, "_ACK_TIMEOUT", 0.2)
+    yield port
+    await port.close()
+
+
+@pytest.fixture
+async def controller():
+    controller = MatrioController("127.0.0.1")
+    yield controller
+    await controller._close_upnp_connection()
+
+
+async def test_keep_alive_connection_is_reused(upnp_port, controller):
+    assert await controller._upnp_request(REQUEST) == OK
+    assert await controller._upnp_request(REQUEST) == OK
+    assert (upnp_port.connections, upnp_port.requests) == (1, 2)
+
+
+@pytest.mark.parametrize("reply", [OK_CLOSE, OK_NO_LENGTH])
+async def test_connection_not_reused_without_keep_alive_framing(upnp_port, controller, reply):
+    upnp_port.replies = [(reply, True)]
+    assert await controller._upnp_request(REQUEST) == reply
+    assert controller._upnp_writer is None
+    assert await controller._upnp_request(REQUEST) == OK
+    assert upnp_port.connections == 2
+
+
+async def test_dropped_idle_connection_is_retried(upnp_port, controller):
+    # The device answers with keep-alive framing, then drops the idle connection
+    upnp_port.replies = [(OK, True)]
+    assert await controller._upnp_request(REQUEST) == OK
+    await asyncio.sleep(0.05)
+    assert await controller._upnp_request(REQUEST) == OK
+    assert (upnp_port.connections, upnp_port.requests) == (2, 2)
+
+
+async def test_missing_reply_times_out_and_closes(upnp_port, controller):
+    upnp_port.replies = [(None, False)]
+    with pytest.raises(TimeoutError):
+        await controller._upnp_request(REQUEST)
+    assert controller._upnp_writer is None
+    assert await controller._upnp_request(REQUEST) == OK
+    assert upnp_port.connections == 2
+
+
+async def test_short_reply_on_fresh_connection_raises(upnp_port, controller):
+    upnp_port.replies = [(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc", True)]
+    with pytest.raises(asyncio.IncompleteReadError):
+        await controller._upnp_request(REQUEST)
+    assert controller._upnp_writer is None
+    assert upnp_port.requests == 1
+
+
+async def test_soap_commands_skip_unusable_replies(upnp_port, controller):
+    upnp_port.replies = [(None, False), (b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc", True)]
+    assert await controller._send_soap_commands()
+    assert upnp_port.requests == 3
+
+
+async def test_subscriptions_skip_unusable_replies(upnp_port, controller):
+    upnp_port.replies = [(None, False), (b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc", True)]
+    assert await controller._setup_upnp_subscriptions()
+    assert (upnp_port.connections, upnp_port.requests) == (3, 3)